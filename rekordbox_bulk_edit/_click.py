@@ -31,7 +31,7 @@ global_click_filters = [
         "--title",
         type=str,
         multiple=True,
-        help="Find track names that include this value",
+        help="Find track names that include this value (literal, case-insensitive)",
     ),
     click.option(
         "--exact-title",
@@ -43,7 +43,7 @@ global_click_filters = [
         "--playlist",
         type=str,
         multiple=True,
-        help="Find tracks in playlists whose names include this value",
+        help="Find tracks in playlists whose names include this value (literal, case-insensitive)",
     ),
     click.option(
         "--exact-playlist",
@@ -55,7 +55,7 @@ global_click_filters = [
         "--artist",
         type=str,
         multiple=True,
-        help="Find tracks whose Artist names include this value",
+        help="Find tracks whose Artist names include this value (literal, case-insensitive)",
     ),
     click.option(
         "--exact-artist",
@@ -67,7 +67,7 @@ global_click_filters = [
         "--album",
         type=str,
         multiple=True,
-        help="Find tracks whose Album names include this value",
+        help="Find tracks whose Album names include this value (literal, case-insensitive)",
     ),
     click.option(
         "--exact-album",
@@ -3,15 +3,16 @@
 import logging
 import os
 import signal
+import subprocess
 import sys
-from pathlib import Path
-from typing import List, Tuple
+import threading
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterable, List, NoReturn, Set, Tuple
 
 import click
 import ffmpeg
 from ffmpeg import Error as FfmpegError
-from pyrekordbox import Rekordbox6Database
-from pyrekordbox.utils import get_rekordbox_pid
 
 from rekordbox_bulk_edit._click import (
     PrintChoice,
@@ -21,23 +22,62 @@ from rekordbox_bulk_edit._click import (
     track_ids_argument,
 )
 from rekordbox_bulk_edit.logger import get_debug_file_path, set_level
-from rekordbox_bulk_edit.query import get_filtered_content
 from rekordbox_bulk_edit.utils import (
     OutputFormats,
     UserQuit,
     confirm,
     get_audio_info,
+    get_audio_info_many,
     get_extension_for_format,
     get_file_type_for_format,
     get_file_type_name,
+    get_file_types_for_format,
     print_track_info,
 )
 
 logger = logging.getLogger(__name__)
 
 
-def convert_to_lossless(input_path, output_path, output_format):
-    """Convert lossless file to another lossless format, preserving bit depth."""
+def run_ffmpeg(stream) -> None:
+    """Run an ffmpeg stream, discarding its output unless it fails.
+
+    Only errors are logged and stats are disabled, so the captured stderr stays
+    small. Raises ffmpeg.Error on a non-zero exit, like stream.run() does.
+
+    stdin is closed: with several ffmpegs running at once, each would otherwise
+    put the terminal in raw mode and read the user's keypresses.
+    """
+    args = stream.global_args("-loglevel", "error", "-nostats").compile()
+    logger.debug(f"Running: {' '.join(args)}")
+    process = subprocess.run(
+        args,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+    if process.returncode != 0:
+        raise FfmpegError("ffmpeg", None, process.stderr)
+
+
+# PCM codec for each bit depth of the uncompressed formats; the first entry is the
+# fallback for bit depths without one. FLAC's codec handles every bit depth.
+LOSSLESS_CODECS: Dict[str, Dict[int, str] | None] = {
+    "aiff": {16: "pcm_s16be", 24: "pcm_s24be", 32: "pcm_s32be"},
+    "wav": {16: "pcm_s16le", 24: "pcm_s24le", 32: "pcm_s32le"},
+    "flac": None,
+}
+
+
+def convert_to_lossless(
+    input_path, output_path, output_format, audio_info=None, threads=None
+) -> Tuple[bool, int | None]:
+    """Convert lossless file to another lossless format, preserving bit depth.
+
+    audio_info is the source's get_audio_info result, if already known.
+    threads caps ffmpeg's decoder and encoder threads; None leaves it to ffmpeg.
+    Returns a (success, bit_depth) tuple, where bit_depth is the sample width the
+    chosen codec writes, so callers don't need to probe the output to learn it.
+    """
     from rekordbox_bulk_edit.utils import ffmpeg_in_path, get_ffmpeg_directions
 
     logger.debug(
@@ -47,57 +87,64 @@ def convert_to_lossless(input_path, output_path, output_format):
     if not ffmpeg_in_path():
         raise Exception(f"FFmpeg not found in PATH.{get_ffmpeg_directions()}")
 
-    audio_info = get_audio_info(input_path)
+    if audio_info is None:
+        audio_info = get_audio_info(input_path)
     bit_depth = audio_info["bit_depth"]
     logger.debug(
         f"Source audio: bit_depth={bit_depth}, sample_rate={audio_info.get('sample_rate')}, channels={audio_info.get('channels')}"
     )
 
-    codec_maps = {
-        "aiff": {16: "pcm_s16be", 24: "pcm_s24be", 32: "pcm_s32be"},
-        "wav": {16: "pcm_s16le", 24: "pcm_s24le", 32: "pcm_s32le"},
-        "flac": None,
-    }
-
-    if output_format.value not in codec_maps:
+    if output_format.value not in LOSSLESS_CODECS:
         raise Exception(f"Unsupported lossless format: {output_format}")
 
-    codec_map = codec_maps[output_format.value]
+    codec_map = LOSSLESS_CODECS[output_format.value]
+    output_bit_depth = bit_depth
     if codec_map is None:
         codec = output_format.value
     elif bit_depth in codec_map:
         codec = codec_map[bit_depth]
     else:
-        codec = list(codec_map.values())[0]
+        output_bit_depth, codec = next(iter(codec_map.items()))
         logger.debug(f"bit_depth={bit_depth} not in codec map, falling back to {codec}")
 
     logger.debug(f"Selected codec: {codec} (bit_depth={bit_depth})")
 
-    output_options = {"acodec": codec, "map_metadata": 0, "write_id3v2": 1}
+    # Copy embedded cover art as-is rather than letting the muxer re-encode it
+    output_options = {
+        "acodec": codec,
+        "vcodec": "copy",
+        "map_metadata": 0,
+        "write_id3v2": 1,
+    }
+    input_options = {}
+    if threads:
+        input_options["threads"] = output_options["threads"] = threads
     logger.debug(f"Invoking ffmpeg with options: {output_options}")
 
     try:
-        (
-            ffmpeg.input(input_path)
+        run_ffmpeg(
+            ffmpeg.input(input_path, **input_options)
             .output(output_path, **output_options)
             .overwrite_output()
-            .run(capture_stdout=True, capture_stderr=True)
         )
         logger.debug(f"Conversion to {output_format.value} succeeded: {output_path}")
-        return True
+        return True, output_bit_depth
     except FfmpegError as e:
         logger.error(f"FFmpeg conversion failed for {input_path}: {e}")
         if e.stderr:
             stderr = e.stderr.decode() if isinstance(e.stderr, bytes) else e.stderr
             logger.debug(f"FFmpeg stderr:\n{stderr}")
-        return False
+        return False, None
     except Exception as e:
         logger.error(f"Conversion failed for {input_path}: {e}")
         raise e
 
 
-def convert_to_mp3(input_path, mp3_path):
-    """Convert lossless file to MP3 320kbps CBR."""
+def convert_to_mp3(input_path, mp3_path, threads=None):
+    """Convert lossless file to MP3 320kbps CBR.
+
+    threads caps ffmpeg's decoder and encoder threads; None leaves it to ffmpeg.
+    """
     from rekordbox_bulk_edit.utils import ffmpeg_in_path, get_ffmpeg_directions
 
     logger.debug(f"convert_to_mp3: {input_path} -> {mp3_path}")
@@ -114,21 +161,18 @@ def convert_to_mp3(input_path, mp3_path):
         output_options = {
             "acodec": acodec,
             "audio_bitrate": audio_bitrate,
+            "vcodec": "copy",
             "map_metadata": map_metadata,
             "write_id3v2": write_id3v2,
         }
+        input_options = {}
+        if threads:
+            input_options["threads"] = output_options["threads"] = threads
         logger.debug(f"Invoking ffmpeg with options: {output_options}")
-        (
-            ffmpeg.input(input_path)
-            .output(
-                mp3_path,
-                acodec=acodec,
-                audio_bitrate=audio_bitrate,
-                map_metadata=map_metadata,
-                write_id3v2=write_id3v2,
-            )
+        run_ffmpeg(
+            ffmpeg.input(input_path, **input_options)
+            .output(mp3_path, **output_options)
             .overwrite_output()
-            .run(capture_stdout=True, capture_stderr=True)
         )
 
         logger.debug(f"Conversion to mp3 succeeded: {mp3_path}")
@@ -144,23 +188,79 @@ def convert_to_mp3(input_path, mp3_path):
         raise e
 
 
+def convert_file(
+    input_path, output_path, format_out, audio_info=None, threads=None
+) -> Tuple[bool, int | None]:
+    """Convert a single file to the given output format.
+
+    Returns a (success, bit_depth) tuple; bit_depth is None for lossy output.
+    Touches neither the database nor the terminal, so it is safe to run from a
+    worker thread.
+    """
+    if format_out.upper() == "MP3":
+        return convert_to_mp3(input_path, output_path, threads), None
+    return convert_to_lossless(
+        input_path, output_path, OutputFormats(format_out.lower()), audio_info, threads
+    )
+
+
+def get_output_bitrate(output_format, audio_info, bit_depth) -> int | None:
+    """Work out the bitrate of a converted file from how it was encoded.
+
+    MP3 output is always 320kbps CBR and PCM (WAV/AIFF) output is
+    sample rate x bit depth x channels, so neither needs to be probed afterwards.
+    Returns None when the bitrate can't be derived (e.g. FLAC, or unknown source
+    info).
+    """
+    if output_format.upper() == "MP3":
+        return 320
+    if output_format.upper() not in ["AIFF", "WAV"] or not audio_info:
+        return None
+
+    sample_rate = audio_info.get("sample_rate")
+    channels = audio_info.get("channels")
+    if not (sample_rate and channels and bit_depth):
+        return None
+    return sample_rate * bit_depth * channels // 1000
+
+
 def update_database_record(
-    db, content_id, new_filename, new_folder, output_format
-) -> None:
-    """Update database record with new file information."""
+    content,
+    new_filename,
+    new_folder,
+    output_format,
+    converted_bit_depth=None,
+    converted_bitrate=None,
+) -> Dict[str, object]:
+    """Validate a converted file and build the update for its database record.
+
+    content is the DjmdContent row the file was converted from, as already loaded
+    by the query. Returns a parameter set for a bulk UPDATE by primary key; the record
+    itself is left untouched so the whole batch can be written in one go.
+
+    converted_bit_depth and converted_bitrate are what the conversion is known to
+    have written. The converted file is only probed for whichever is missing.
+    """
     logger.debug(
-        f"update_database_record: content_id={content_id}, new_filename={new_filename}, output_format={output_format}"
+        f"update_database_record: content_id={content.ID}, new_filename={new_filename}, output_format={output_format}"
     )
-    content = db.get_content().filter_by(ID=content_id).first()
-    if not content:
-        raise Exception(f"Content record with ID {content_id} not found")
 
     converted_full_path = os.path.join(new_folder, new_filename)
-    logger.debug(f"Probing converted file: {converted_full_path}")
-    converted_audio_info = get_audio_info(converted_full_path)
-    converted_bitrate = converted_audio_info["bitrate"]
-
-    if output_format.upper() == "MP3" and converted_bitrate is None:
+    is_lossless = output_format in ["AIFF", "FLAC", "WAV"]
+
+    # FLAC's bitrate is stored as 0, so there's nothing to probe for once the
+    # bit depth is known
+    needs_bitrate = converted_bitrate is None and output_format != "FLAC"
+    needs_bit_depth = is_lossless and converted_bit_depth is None
+    if needs_bitrate or needs_bit_depth:
+        logger.debug(f"Probing converted file: {converted_full_path}")
+        converted_audio_info = get_audio_info(converted_full_path)
+        if converted_bitrate is None:
+            converted_bitrate = converted_audio_info["bitrate"]
+        if converted_bit_depth is None:
+            converted_bit_depth = converted_audio_info["bit_depth"]
+
+    if output_format == "MP3" and converted_bitrate is None:
         logger.debug("MP3 bitrate not found in probe, assuming 320kbps")
         converted_bitrate = 320
 
@@ -168,9 +268,8 @@ def update_database_record(
     if not file_type:
         raise Exception(f"Unsupported output format: {output_format}")
 
-    if output_format.upper() in ["AIFF", "FLAC", "WAV"]:
-        converted_bit_depth = converted_audio_info["bit_depth"]
-        database_bit_depth = getattr(content, "BitDepth", None)
+    if is_lossless:
+        database_bit_depth = content.BitDepth
         logger.debug(
             f"Bit depth check: database={database_bit_depth}, file={converted_bit_depth}"
         )
@@ -184,21 +283,20 @@ def update_database_record(
                 f"Bit depth mismatch for lossless transcode: database={database_bit_depth}, file={converted_bit_depth}"
             )
 
-    content.FileNameL = new_filename
-    content.FolderPath = converted_full_path
-    content.FileType = file_type
-
     # FLAC stores bitrate as 0 in Rekordbox to represent VBR
-    if output_format.upper() == "FLAC":
-        content.BitRate = 0
-        logger.debug(
-            f"Set FileType={file_type}, BitRate=0 (FLAC), FolderPath={converted_full_path}"
-        )
-    else:
-        content.BitRate = converted_bitrate
-        logger.debug(
-            f"Set FileType={file_type}, BitRate={converted_bitrate}, FolderPath={converted_full_path}"
-        )
+    if output_format == "FLAC":
+        converted_bitrate = 0
+
+    logger.debug(
+        f"Set FileType={file_type}, BitRate={converted_bitrate}, FolderPath={converted_full_path}"
+    )
+    return {
+        "ID": content.ID,
+        "FileNameL": new_filename,
+        "FolderPath": converted_full_path,
+        "FileType": file_type,
+        "BitRate": converted_bitrate,
+    }
 
 
 def cleanup_converted_files(converted_files) -> None:
@@ -240,11 +338,70 @@ def get_output_path(content, output_format) -> Tuple[str, str, str]:
     src_dirname = os.path.dirname(src_folder_path)
 
     extension = get_extension_for_format(output_format.upper())
-    output_filename = Path(src_file_name).stem + extension
+    output_filename = os.path.splitext(src_file_name)[0] + extension
     output_path = os.path.join(src_dirname, output_filename)
     return output_path, output_filename, src_dirname
 
 
+def get_partial_output_path(output_path: str) -> str:
+    """Path that ffmpeg writes to before the output is moved into place.
+
+    A hidden sibling of output_path ending in the same name, so ffmpeg still picks
+    the format from the extension and the move is a rename on the same filesystem.
+    """
+    dirname, filename = os.path.split(output_path)
+    return os.path.join(dirname, f".partial-{filename}")
+
+
+def _normalize_file_name(name: str) -> str:
+    return unicodedata.normalize("NFC", name).casefold()
+
+
+def _list_folder(dirname: str) -> Set[str] | None:
+    """Normalized names of a folder's entries, or None if it can't be listed."""
+    try:
+        with os.scandir(dirname or ".") as entries:
+            return {_normalize_file_name(entry.name) for entry in entries}
+    except OSError:
+        return None
+
+
+def list_folders(
+    paths: Iterable[str], listings: Dict[str, Set[str] | None], workers=None
+) -> None:
+    """Fill listings for the folders of several files, listing them concurrently.
+
+    On network shares and external drives every listing is a round trip, so
+    doing them in parallel up front hides most of that latency from the
+    file_exists checks that follow. Folders already in listings are skipped.
+    """
+    dirnames = list({os.path.dirname(path) for path in paths} - listings.keys())
+    if len(dirnames) <= 1:
+        listings.update((dirname, _list_folder(dirname)) for dirname in dirnames)
+        return
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        listings.update(zip(dirnames, executor.map(_list_folder, dirnames)))
+
+
+def file_exists(path: str, listings: Dict[str, Set[str] | None]) -> bool:
+    """Check whether a file exists, listing each folder only once.
+
+    listings caches the entry names of every folder seen so far, so checking many
+    files in the same folder costs a single scandir instead of a stat per file.
+    Names are compared ignoring case and Unicode normalization, like the default
+    macOS filesystem does; on a case-sensitive one a near-clash errs towards
+    "exists". Folders that can't be listed fall back to os.path.exists.
+    """
+    dirname, name = os.path.split(path)
+    if dirname not in listings:
+        listings[dirname] = _list_folder(dirname)
+
+    names = listings[dirname]
+    if names is None:
+        return os.path.exists(path)
+    return _normalize_file_name(name) in names
+
+
 @click.command(
     epilog=f"Debug logs for each run can be found at:\n{get_debug_file_path().parent}"
 )
@@ -281,6 +438,13 @@ def get_output_path(content, output_format) -> Tuple[str, str, str]:
     default="aiff",
     help="Output format (default: aiff)",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of files to convert in parallel (default: number of CPUs)",
+)
 @add_click_options([*global_click_filters, print_option, track_ids_argument])
 def convert_command(
     dry_run,
@@ -289,6 +453,7 @@ def convert_command(
     overwrite,
     interactive,
     format_out,
+    jobs: int | None,
     track_id: List[str] | None,
     track_ids: List[str] | None,
     title: List[str] | None,
@@ -310,10 +475,22 @@ def convert_command(
 
     Skips lossy formats and files already in the target format.
     """
+    # pyrekordbox pulls in SQLAlchemy and the whole schema, so it's imported here
+    # rather than at module level to keep --help and usage errors fast
+    from pyrekordbox import Rekordbox6Database
+    from pyrekordbox.db6 import DjmdContent
+    from pyrekordbox.utils import get_rekordbox_pid
+    from sqlalchemy import update
+
+    from rekordbox_bulk_edit.query import get_filtered_content
     from rekordbox_bulk_edit.utils import ffmpeg_in_path, get_ffmpeg_directions
 
     set_level(print_opt)
 
+    # Click hands back the choice as listed (lowercase); the upper-case name is
+    # what the database helpers and messages use
+    format_name = format_out.upper()
+
     piped_stdin = not sys.stdin.isatty()
     if piped_stdin:
         stdin_data = sys.stdin.read().strip()
@@ -335,10 +512,8 @@ def convert_command(
 
     # Determine delete behavior: smart default based on output format
     if delete is None:
-        should_delete = format_out.upper() != "MP3"
-        logger.debug(
-            f"Delete originals: {should_delete} (default for {format_out.upper()})"
-        )
+        should_delete = format_name != "MP3"
+        logger.debug(f"Delete originals: {should_delete} (default for {format_name})")
     else:
         should_delete = delete
         logger.debug(
@@ -347,14 +522,30 @@ def convert_command(
 
     db = None
     converted_files = []
+    interrupted = threading.Event()
+    converting = False
 
     def signal_handler(_signum, frame):
+        # Repeated Ctrl-C while stopping must not start a second rollback
+        if interrupted.is_set():
+            return
+        interrupted.set()
         logger.info("\nInterrupted. Rolling back...")
+        if converting:
+            # The convert loop stops dispatching, waits for the running
+            # conversions to end and then rolls back, cleaning up their outputs
+            return
         rollback_and_cleanup(db, converted_files)
         sys.exit(1)
 
     signal.signal(signal.SIGINT, signal_handler)
 
+    def abort(message: str) -> NoReturn:
+        """Log an error, undo everything done so far and exit."""
+        logger.error(message)
+        rollback_and_cleanup(db, converted_files)
+        sys.exit(1)
+
     try:
         # === PRECONDITIONS ===
         rekordbox_pid = get_rekordbox_pid()
@@ -386,6 +577,13 @@ def convert_command(
         logger.debug("Database connection established")
 
         # === QUERY & FILTER ===
+        # Lossy sources and files already in the target format are excluded in
+        # the query so they never get loaded
+        excluded_file_types = sorted(
+            get_file_types_for_format(format_out)
+            | get_file_types_for_format("MP3")
+            | get_file_types_for_format("M4A")
+        )
         result = get_filtered_content(
             db,
             track_id_args=track_ids,
@@ -400,36 +598,34 @@ def convert_command(
             titles=title,
             exact_titles=exact_title,
             match_all=match_all,
+            exclude_file_types=excluded_file_types,
         )
-        filtered_content = result.scalars().all()
-        logger.debug(f"Query returned {len(filtered_content)} tracks")
-
-        target_file_type = get_file_type_for_format(format_out)
-        mp3_type = get_file_type_for_format("MP3")
-        m4a_type = get_file_type_for_format("M4A")
-
-        files_to_convert = [
-            content
-            for content in filtered_content
-            if content.FileType != target_file_type
-            and content.FileType != mp3_type
-            and content.FileType != m4a_type
-        ]
-
-        logger.debug(
-            f"After format filter: {len(files_to_convert)} tracks need conversion (skipped {len(filtered_content) - len(files_to_convert)} already in target format or lossy)"
-        )
+        files_to_convert = result.scalars().all()
+        logger.debug(f"Query returned {len(files_to_convert)} tracks to convert")
 
         if not files_to_convert:
             logger.info("No files need conversion.")
             return
 
         # === CONFLICT CHECK ===
+        # Only reflects files present before conversion starts; outputs written
+        # below are checked on disk directly
+        dir_listings: Dict[str, Set[str] | None] = {}
+        # Worked out once here and reused by the convert loop
+        output_paths: Dict[str, Tuple[str, str, str]] = {
+            content.ID: get_output_path(content, format_out)
+            for content in files_to_convert
+        }
+        # Outputs go next to their sources, so these listings serve the source
+        # checks below as well
+        list_folders(
+            (output_path for output_path, _, _ in output_paths.values()), dir_listings
+        )
         conflicts = []
         convertible = []
         for content in files_to_convert:
-            output_path, _, _ = get_output_path(content, format_out)
-            if os.path.exists(output_path):
+            output_path = output_paths[content.ID][0]
+            if file_exists(output_path, dir_listings):
                 conflicts.append(content)
             else:
                 convertible.append(content)
@@ -453,9 +649,7 @@ def convert_command(
         files_to_process = convertible if not overwrite else files_to_convert
 
         # === PREVIEW ===
-        logger.info(
-            f"Found {len(files_to_process)} files to convert to {format_out.upper()}"
-        )
+        logger.info(f"Found {len(files_to_process)} files to convert to {format_name}")
         print_track_info(files_to_process)
 
         if dry_run:
@@ -467,7 +661,7 @@ def convert_command(
         if not yes and not interactive:
             try:
                 if not confirm(
-                    f"Convert {len(files_to_process)} files to {format_out.upper()}?",
+                    f"Convert {len(files_to_process)} files to {format_name}?",
                     default=True,
                 ):
                     logger.info("Cancelled.")
@@ -476,20 +670,18 @@ def convert_command(
                 return
 
         # === CONVERT ===
+        pending = []
         for i, content in enumerate(files_to_process, 1):
             src_folder_path = content.FolderPath or ""
             src_file_name = content.FileNameL or ""
-            src_format = get_file_type_name(content.FileType)
-            output_path, output_filename, src_dirname = get_output_path(
-                content, format_out
-            )
-
-            logger.info(f"[{i}/{len(files_to_process)}] {src_file_name}")
+            output_path, output_filename, src_dirname = output_paths[content.ID]
 
             if interactive:
+                src_format = get_file_type_name(content.FileType)
+                logger.info(f"[{i}/{len(files_to_process)}] {src_file_name}")
                 try:
                     if not confirm(
-                        f"  Convert {src_format} to {format_out.upper()}?", default=True
+                        f"  Convert {src_format} to {format_name}?", default=True
                     ):
                         continue
                 except UserQuit:
@@ -497,47 +689,162 @@ def convert_command(
                     rollback_and_cleanup(db, converted_files)
                     return
 
-            if not os.path.exists(src_folder_path):
-                logger.error(f"  Source not found: {src_folder_path}")
-                rollback_and_cleanup(db, converted_files)
-                sys.exit(1)
+            if not file_exists(src_folder_path, dir_listings):
+                abort(f"  Source not found: {src_folder_path}")
 
-            if os.path.exists(output_path) and not overwrite:
-                logger.debug("  Skipping: output already exists")
+            if file_exists(output_path, dir_listings) and not overwrite:
+                logger.debug(f"  Skipping {src_file_name}: output already exists")
                 continue
 
-            if format_out.upper() == "MP3":
-                success = convert_to_mp3(src_folder_path, output_path)
-            else:
-                success = convert_to_lossless(
-                    src_folder_path, output_path, OutputFormats(format_out.lower())
-                )
+            pending.append(
+                {
+                    "source_path": src_folder_path,
+                    "source_name": src_file_name,
+                    "output_path": output_path,
+                    "partial_path": get_partial_output_path(output_path),
+                    "output_filename": output_filename,
+                    "output_dirname": src_dirname,
+                    "content_id": content.ID,
+                    "content": content,
+                }
+            )
 
-            if not success:
-                logger.error("  Conversion failed. Aborting.")
-                rollback_and_cleanup(db, converted_files)
-                sys.exit(1)
+        # Work through the files folder by folder (albums, usually), so reads and
+        # writes stay together on disk and in the OS cache. The preview and
+        # prompts above keep the query's order.
+        pending.sort(key=lambda job: (job["output_dirname"], job["source_name"]))
 
-            if not os.path.exists(output_path):
-                logger.error("  Output file not created. Aborting.")
-                rollback_and_cleanup(db, converted_files)
-                sys.exit(1)
+        # No point starting more workers than there are files
+        max_workers = max(1, min(jobs or os.cpu_count() or 1, len(pending)))
 
-            try:
-                update_database_record(
-                    db, content.ID, output_filename, src_dirname, format_out.upper()
-                )
-                converted_files.append(
-                    {
-                        "source_path": src_folder_path,
-                        "output_path": output_path,
-                        "content_id": content.ID,
-                    }
+        # Read every source up front so an unreadable file aborts the batch
+        # before anything has been written
+        if format_name != "MP3":
+            logger.debug(f"Reading audio info for {len(pending)} source files")
+            source_infos = get_audio_info_many(
+                [job["source_path"] for job in pending], max_workers
+            )
+            for job, audio_info in zip(pending, source_infos):
+                job["audio_info"] = audio_info
+
+        # Each ffmpeg gets one thread when several run at once, so N workers
+        # don't each start a thread per core and fight over the CPU
+        ffmpeg_threads = 1 if max_workers > 1 else None
+        logger.debug(f"Converting {len(pending)} files with {max_workers} worker(s)")
+
+        conversion_error = None
+        update_error = None
+        failed = []
+        missing = []
+        pending_updates = []
+        # ffmpeg does the work in its own process, so threads are enough to keep
+        # several conversions in flight while the DB session stays on this thread.
+        # SQLAlchemy sessions aren't thread-safe, so each record's update is built
+        # here as its file finishes, overlapping the conversions still running.
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        converting = True
+        try:
+            futures = {
+                executor.submit(
+                    convert_file,
+                    job["source_path"],
+                    job["partial_path"],
+                    format_out,
+                    job.get("audio_info"),
+                    ffmpeg_threads,
+                ): job
+                for job in pending
+            }
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                job = futures[future]
+                try:
+                    success, job["bit_depth"] = future.result()
+                except Exception as e:
+                    conversion_error = conversion_error or e
+                    success = False
+
+                if not success:
+                    failed.append(job)
+                elif not os.path.exists(job["partial_path"]):
+                    missing.append(job)
+                    success = False
+                else:
+                    try:
+                        # Only a finished conversion replaces an existing output,
+                        # so a failure or Ctrl-C never leaves a half-written one
+                        os.replace(job["partial_path"], job["output_path"])
+                    except OSError as e:
+                        conversion_error = conversion_error or e
+                        failed.append(job)
+                        success = False
+
+                if success:
+                    converted_files.append(job)
+                    logger.info(
+                        f"[{len(converted_files)}/{len(pending)}] {job['source_name']}"
+                    )
+                    try:
+                        pending_updates.append(
+                            update_database_record(
+                                job["content"],
+                                job["output_filename"],
+                                job["output_dirname"],
+                                format_name,
+                                job["bit_depth"],
+                                get_output_bitrate(
+                                    format_out, job.get("audio_info"), job["bit_depth"]
+                                ),
+                            )
+                        )
+                        # Ctrl-C starts no more conversions
+                        if not interrupted.is_set():
+                            continue
+                    except Exception as e:
+                        update_error = e
+
+                # Stop dispatching; conversions already running are drained so
+                # their outputs get cleaned up along with the rest.
+                for other in futures:
+                    other.cancel()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            converting = False
+
+        # A failed ffmpeg can leave a half-written file behind, and Ctrl-C reaches
+        # the whole process group, so it kills the running ffmpegs too. Those files
+        # are only ever at the partial paths, never at an existing output. Every
+        # branch below that sees failures aborts, so they're removed with the rest.
+        converted_files.extend(
+            {**job, "output_path": job["partial_path"]} for job in failed + missing
+        )
+
+        # Checked first: an interrupt also stops ffmpeg, which shows up as failures
+        if interrupted.is_set():
+            rollback_and_cleanup(db, converted_files)
+            sys.exit(1)
+        if conversion_error:
+            raise conversion_error
+        if failed:
+            abort("  Conversion failed. Aborting.")
+        if missing:
+            abort("  Output file not created. Aborting.")
+        if update_error:
+            abort(f"  Database update failed: {update_error}")
+
+        # === UPDATE DATABASE ===
+        # Written as one executemany UPDATE ... WHERE ID = ?. The rows already in
+        # the session are expired by the commit, so there's nothing to synchronize
+        try:
+            if pending_updates:
+                db.session.execute(
+                    update(DjmdContent),
+                    pending_updates,
+                    execution_options={"synchronize_session": False},
                 )
-            except Exception as e:
-                logger.error(f"  Database update failed: {e}")
-                rollback_and_cleanup(db, converted_files)
-                sys.exit(1)
+        except Exception as e:
+            abort(f"  Database update failed: {e}")
 
         # === COMMIT ===
         if not converted_files:
@@ -546,13 +853,9 @@ def convert_command(
 
         try:
             db.session.commit()
-            logger.info(
-                f"\nConverted {len(converted_files)} files to {format_out.upper()}"
-            )
+            logger.info(f"\nConverted {len(converted_files)} files to {format_name}")
         except Exception as e:
-            logger.error(f"Commit failed: {e}")
-            rollback_and_cleanup(db, converted_files)
-            sys.exit(1)
+            abort(f"Commit failed: {e}")
 
         # === OUTPUT ===
         if print_opt is PrintChoice.IDS:
@@ -5,7 +5,6 @@ import sys
 from typing import List
 
 import click
-from pyrekordbox import Rekordbox6Database
 
 from rekordbox_bulk_edit._click import (
     PrintChoice,
@@ -15,8 +14,8 @@ from rekordbox_bulk_edit._click import (
     track_ids_argument,
 )
 from rekordbox_bulk_edit.logger import get_debug_file_path, set_level
-from rekordbox_bulk_edit.query import get_filtered_content
 from rekordbox_bulk_edit.utils import (
+    DEFAULT_PRINT_COLUMNS,
     print_track_info,
 )
 
@@ -43,6 +42,9 @@ def search_command(
     print_opt: PrintChoice | None,
 ):
     """Search the RekordBox database."""
+    from pyrekordbox import Rekordbox6Database
+
+    from rekordbox_bulk_edit.query import get_filtered_content
 
     set_level(print_opt)
 
@@ -85,6 +87,11 @@ def search_command(
     if not db.session:
         raise RuntimeError("Failed to connect to Rekordbox Database: No Session.")
 
+    # The track listing only reads a few columns, so don't build ORM objects for it
+    columns = None
+    if print_opt not in (PrintChoice.SILENT, PrintChoice.IDS):
+        columns = [field.value for field in DEFAULT_PRINT_COLUMNS]
+
     filtered_result = get_filtered_content(
         db,
         track_id_args=track_ids,
@@ -99,11 +106,13 @@ def search_command(
         exact_titles=exact_title,
         formats=format,
         match_all=match_all,
+        only_ids=print_opt is PrintChoice.IDS,
+        columns=columns,
     )
 
     if print_opt is PrintChoice.SILENT:
         pass
     elif print_opt is PrintChoice.IDS:
-        print(" ".join(content.ID for content in filtered_result.scalars().all()))
+        print(" ".join(filtered_result.scalars().all()))
     else:
-        print_track_info(filtered_result.scalars().all())
+        print_track_info(filtered_result.all())
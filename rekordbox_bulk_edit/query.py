@@ -1,5 +1,5 @@
 import logging
-from typing import List, Tuple, Union
+from typing import List, Sequence, Tuple, Union
 
 from pyrekordbox import Rekordbox6Database
 from pyrekordbox.db6.tables import (
@@ -9,26 +9,44 @@ from pyrekordbox.db6.tables import (
     DjmdPlaylist,
     DjmdSongPlaylist,
 )
-from sqlalchemy import Result, and_, func, or_, select
+from sqlalchemy import Result, and_, exists, func, or_, select
 from sqlalchemy.orm import aliased
 
 logger = logging.getLogger(__name__)
 
 
+def _substring_pattern(value: str) -> str:
+    """Build a LIKE pattern matching value as a literal substring.
+
+    LIKE wildcards in value are escaped with a backslash, so "%" and "_" in a
+    user's filter match themselves rather than any character.
+    """
+    escaped = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
 class CollectionQuery:
     def __init__(self, match_all=False):
         self._stmt = select(DjmdContent)
         self._conditions = []
+        self._excluded_file_types = []
         self._limit_count = None
         self._match_all = match_all
+        self._columns: Tuple[str, ...] = ()
+        self._aliases = {}
 
     def _copy(self) -> "CollectionQuery":
         """Create a copy of this query in its current state."""
         new_inst = CollectionQuery.__new__(CollectionQuery)
-        new_inst._stmt = self._stmt._clone()
+        # Select is generative: outerjoin() etc. return a new statement, so the copy
+        # can share it instead of cloning
+        new_inst._stmt = self._stmt
         new_inst._conditions = self._conditions.copy()
+        new_inst._excluded_file_types = self._excluded_file_types.copy()
         new_inst._limit_count = self._limit_count
         new_inst._match_all = self._match_all
+        new_inst._columns = self._columns
+        new_inst._aliases = self._aliases.copy()
         return new_inst
 
     def match_any(self) -> "CollectionQuery":
@@ -55,17 +73,22 @@ class CollectionQuery:
         """Filter by artist name."""
 
         new_inst = self._copy()
-        ArtistAlias = aliased(DjmdArtist)
-        new_inst._stmt = new_inst._stmt.outerjoin(
-            ArtistAlias, DjmdContent.ArtistID == ArtistAlias.ID
-        )
+        # A track has one artist, so every artist filter can share a single join.
+        ArtistAlias = new_inst._aliases.get(DjmdArtist)
+        if ArtistAlias is None:
+            ArtistAlias = new_inst._aliases[DjmdArtist] = aliased(DjmdArtist)
+            new_inst._stmt = new_inst._stmt.outerjoin(
+                ArtistAlias, DjmdContent.ArtistID == ArtistAlias.ID
+            )
 
         if not artist_name:
             condition = ArtistAlias.Name.is_(None)
         elif exact:
             condition = ArtistAlias.Name == artist_name
         else:
-            condition = ArtistAlias.Name.ilike(f"%{artist_name}%")
+            condition = ArtistAlias.Name.ilike(
+                _substring_pattern(artist_name), escape="\\"
+            )
 
         new_inst._conditions.append(condition)
         return new_inst
@@ -80,7 +103,7 @@ class CollectionQuery:
         elif exact:
             condition = DjmdContent.Title == title
         else:
-            condition = DjmdContent.Title.ilike(f"%{title}%")
+            condition = DjmdContent.Title.ilike(_substring_pattern(title), escape="\\")
 
         new_inst._conditions.append(condition)
         return new_inst
@@ -89,45 +112,56 @@ class CollectionQuery:
         """Filter by album name."""
 
         new_inst = self._copy()
-        AlbumAlias = aliased(DjmdAlbum)
-        new_inst._stmt = new_inst._stmt.outerjoin(
-            AlbumAlias, DjmdContent.AlbumID == AlbumAlias.ID
-        )
+        AlbumAlias = new_inst._aliases.get(DjmdAlbum)
+        if AlbumAlias is None:
+            AlbumAlias = new_inst._aliases[DjmdAlbum] = aliased(DjmdAlbum)
+            new_inst._stmt = new_inst._stmt.outerjoin(
+                AlbumAlias, DjmdContent.AlbumID == AlbumAlias.ID
+            )
 
         if not album_name:
             condition = DjmdContent.AlbumID.is_(None)
         elif exact:
             condition = AlbumAlias.Name == album_name
         else:
-            condition = AlbumAlias.Name.ilike(f"%{album_name}%")
+            condition = AlbumAlias.Name.ilike(
+                _substring_pattern(album_name), escape="\\"
+            )
 
         new_inst._conditions.append(condition)
         return new_inst
 
     def by_playlist(self, playlist_name: str, exact: bool = False) -> "CollectionQuery":
-        """Filter by playlist name."""
+        """Filter by playlist name.
 
-        new_inst = self._copy()
-        PlaylistAlias = aliased(DjmdPlaylist)
-        SongPlaylistAlias = aliased(DjmdSongPlaylist)
+        Uses an EXISTS subquery rather than a join: a track can be in many
+        playlists, and joining would return it once per matching playlist.
+        """
 
-        new_inst._stmt = new_inst._stmt.outerjoin(
-            SongPlaylistAlias, DjmdContent.ID == SongPlaylistAlias.ContentID
-        ).outerjoin(PlaylistAlias, SongPlaylistAlias.PlaylistID == PlaylistAlias.ID)
+        new_inst = self._copy()
+        in_playlist = DjmdSongPlaylist.ContentID == DjmdContent.ID
 
         if not playlist_name:
-            condition = SongPlaylistAlias.ContentID.is_(None)
-        elif exact:
-            condition = PlaylistAlias.Name == playlist_name
+            condition = ~exists().where(in_playlist)
         else:
-            condition = PlaylistAlias.Name.ilike(f"%{playlist_name}%")
+            if exact:
+                name_condition = DjmdPlaylist.Name == playlist_name
+            else:
+                name_condition = DjmdPlaylist.Name.ilike(
+                    _substring_pattern(playlist_name), escape="\\"
+                )
+            condition = exists().where(
+                in_playlist,
+                DjmdSongPlaylist.PlaylistID == DjmdPlaylist.ID,
+                name_condition,
+            )
 
         new_inst._conditions.append(condition)
         return new_inst
 
     def by_format(self, format_name: str) -> "CollectionQuery":
         """Filter by file format."""
-        from rekordbox_bulk_edit.utils import get_file_type_for_format
+        from rekordbox_bulk_edit.utils import get_file_types_for_format
 
         if not format_name:
             logger.warning("Empty format filter has no effect")
@@ -136,13 +170,37 @@ class CollectionQuery:
         new_inst = self._copy()
 
         try:
-            file_type_code = get_file_type_for_format(format_name)
-            condition = DjmdContent.FileType == file_type_code
+            file_type_codes = get_file_types_for_format(format_name)
+            condition = DjmdContent.FileType.in_(sorted(file_type_codes))
             new_inst._conditions.append(condition)
         except ValueError:
             logger.warning(f"Invalid format: {format_name}")
         return new_inst
 
+    def without_file_types(self, file_types: List[int]) -> "CollectionQuery":
+        """Exclude tracks with the given FileType codes.
+
+        Unlike the by_* filters, exclusions always apply, regardless of whether the
+        other filters are combined with AND or OR.
+        """
+        new_inst = self._copy()
+        new_inst._excluded_file_types.extend(file_types)
+        return new_inst
+
+    def only_columns(self, *names: str) -> "CollectionQuery":
+        """Select only the named DjmdContent columns instead of whole rows.
+
+        Results are plain rows, which are much cheaper to build than ORM objects
+        when the tracks are only read.
+        """
+        new_inst = self._copy()
+        new_inst._columns = names
+        return new_inst
+
+    def only_ids(self) -> "CollectionQuery":
+        """Select only the IDs of matching tracks instead of whole rows."""
+        return self.only_columns("ID")
+
     def limit(self, count: int) -> "CollectionQuery":
         """Limit query results to the first {count} items."""
         new_inst = self._copy()
@@ -184,6 +242,15 @@ class CollectionQuery:
                 combined_condition = or_(*self._conditions)
             stmt = stmt.where(combined_condition)
 
+        if self._excluded_file_types:
+            logger.debug(f"Excluding file types: {self._excluded_file_types}")
+            stmt = stmt.where(DjmdContent.FileType.not_in(self._excluded_file_types))
+
+        if self._columns:
+            stmt = stmt.with_only_columns(
+                *(getattr(DjmdContent, name) for name in self._columns)
+            )
+
         if self._limit_count is not None:
             logger.debug(f"Query limit: {self._limit_count}")
             stmt = stmt.limit(self._limit_count)
@@ -205,8 +272,20 @@ def get_filtered_content(
     titles: List[str] | None = None,
     exact_titles: List[str] | None = None,
     match_all: bool = False,
+    exclude_file_types: List[int] | None = None,
+    only_ids: bool = False,
+    columns: Sequence[str] | None = None,
 ) -> Result[Tuple[DjmdContent]]:
-    """Query the Rekordbox database with the provided filters."""
+    """Query the Rekordbox database with the provided filters.
+
+    Tracks whose FileType is in exclude_file_types are never returned.
+    With only_ids, the result holds track IDs rather than DjmdContent rows.
+    With columns, it holds rows of just those DjmdContent columns. The two can't
+    be combined; pass columns=("ID",) to add other columns to the IDs.
+    """
+    if only_ids and columns:
+        raise ValueError("only_ids and columns cannot be used together")
+
     db = db if db is not None else Rekordbox6Database()
     if not db.session:
         raise RuntimeError("Failed to connect to Rekordbox Database: No Session.")
@@ -218,8 +297,7 @@ def get_filtered_content(
         query = query.by_track_ids(track_ids=track_id_args)
 
     if track_ids:
-        for track_id in track_ids:
-            query = query.by_track_ids(track_id)
+        query = query.by_track_ids(track_ids)
 
     if formats:
         for fmt in formats:
@@ -260,4 +338,13 @@ def get_filtered_content(
     if match_all:
         query = query.match_all()
 
+    if exclude_file_types:
+        query = query.without_file_types(exclude_file_types)
+
+    if only_ids:
+        query = query.only_ids()
+
+    if columns:
+        query = query.only_columns(*columns)
+
     return query.execute(db)
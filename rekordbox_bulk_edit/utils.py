@@ -1,14 +1,21 @@
 """Shared utility functions for rekordbox-bulk-edit."""
 
+import functools
 import logging
+import operator
 import platform
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import Dict, Sequence
+from typing import TYPE_CHECKING, Dict, Sequence
 
 import click
 import ffmpeg
-from pyrekordbox.db6 import DjmdContent
+import mutagen
+from mutagen.mp4 import MP4Info
+
+if TYPE_CHECKING:
+    from pyrekordbox.db6 import DjmdContent
 
 logger = logging.getLogger(__name__)
 
@@ -20,17 +27,42 @@ class UserQuit(Exception):
 
 
 # File type mappings for Rekordbox database
+FILE_TYPE_NAMES: Dict[int, str] = {
+    0: "MP3",
+    1: "MP3",
+    4: "M4A",
+    5: "FLAC",
+    11: "WAV",
+    12: "AIFF",
+}
+
+# Code written for records of each format, and every code that means that format
+_FORMAT_FILE_TYPE: Dict[str, int] = {
+    "MP3": 1,
+    "M4A": 4,
+    "FLAC": 5,
+    "WAV": 11,
+    "AIFF": 12,
+}
+_FORMAT_FILE_TYPES: Dict[str, frozenset[int]] = {
+    format_name: frozenset(
+        code for code, name in FILE_TYPE_NAMES.items() if name == format_name
+    )
+    for format_name in _FORMAT_FILE_TYPE
+}
+
+_FORMAT_EXTENSION: Dict[str, str] = {
+    "MP3": ".mp3",
+    "AIFF": ".aiff",
+    "FLAC": ".flac",
+    "WAV": ".wav",
+    "ALAC": ".m4a",
+}
+
+
 def get_file_type_name(file_type_code: int):
     """Get human-readable name for file type code."""
-    _get_file_type_name = {
-        0: "MP3",
-        1: "MP3",
-        4: "M4A",
-        5: "FLAC",
-        11: "WAV",
-        12: "AIFF",
-    }
-    name = _get_file_type_name.get(file_type_code)
+    name = FILE_TYPE_NAMES.get(file_type_code)
     if name is None:
         raise ValueError(f"Unknown file_type: {file_type_code}")
     return name
@@ -40,25 +72,28 @@ def get_file_type_for_format(format_name: str):
     """Get file type code for format name (case-insensitive)."""
     if not format_name:
         raise ValueError("Format name cannot be empty or None")
-    _get_file_type_for_format = {"MP3": 1, "M4A": 4, "FLAC": 5, "WAV": 11, "AIFF": 12}
-    file_type = _get_file_type_for_format.get(format_name.upper())
+    file_type = _FORMAT_FILE_TYPE.get(format_name.upper())
     if file_type is None:
         raise ValueError(f"Unknown format: {format_name}")
     return file_type
 
 
+def get_file_types_for_format(format_name: str) -> frozenset[int]:
+    """Get every file type code that Rekordbox uses for a format name
+    (case-insensitive), e.g. both 0 and 1 for MP3."""
+    if not format_name:
+        raise ValueError("Format name cannot be empty or None")
+    file_types = _FORMAT_FILE_TYPES.get(format_name.upper())
+    if file_types is None:
+        raise ValueError(f"Unknown format: {format_name}")
+    return file_types
+
+
 def get_extension_for_format(format_name: str):
     """Get file extension for format name (case-insensitive)."""
     if not format_name:
         raise ValueError("Format name cannot be empty or None")
-    _get_extension_for_format = {
-        "MP3": ".mp3",
-        "AIFF": ".aiff",
-        "FLAC": ".flac",
-        "WAV": ".wav",
-        "ALAC": ".m4a",
-    }
-    extension = _get_extension_for_format.get(format_name.upper())
+    extension = _FORMAT_EXTENSION.get(format_name.upper())
     if extension is None:
         raise ValueError(f"Unknown format: {format_name}")
     return extension
@@ -92,6 +127,15 @@ class PrintableField(Enum):
     Title = "Title"
 
 
+DEFAULT_PRINT_COLUMNS = [
+    PrintableField.ID,
+    PrintableField.Title,
+    PrintableField.FileType,
+    PrintableField.SampleRate,
+    PrintableField.BitDepth,
+    PrintableField.FolderPath,
+]
+
 # Column widths (total ≈ 240 chars with spacing)
 PRINT_WIDTHS: Dict[PrintableField, int] = {
     PrintableField.ID: 10,
@@ -121,66 +165,94 @@ PRINT_HEADERS: Dict[PrintableField, str] = {
 }
 
 
+# Characters kept from the start and end of a truncated value: 3 chars are
+# reserved for "...", and the start gets 2/5 of the rest
+_TRUNCATE_SPLITS: Dict[PrintableField, tuple[int, int]] = {
+    field: ((width - 3) // 5 * 2, (width - 3) - (width - 3) // 5 * 2)
+    for field, width in PRINT_WIDTHS.items()
+}
+
+
 def truncate_field(field: PrintableField, value: str | None):
-    if value is None:
+    if not value:
         return ""
     if len(value) <= PRINT_WIDTHS[field]:
         return value
-    available = PRINT_WIDTHS[field] - 3  # Reserve 3 chars for "..."
-    start_chars = available // 5 * 2
-    end_chars = available - start_chars
-    return f"{value[:start_chars]}...{value[-end_chars:]}"
+    start_chars, end_chars = _TRUNCATE_SPLITS[field]
+    return value[:start_chars] + "..." + value[-end_chars:]
+
+
+# Columns whose values are cut to fit their width when printed
+_TRUNCATED_FIELDS = frozenset(
+    {
+        PrintableField.FileNameL,
+        PrintableField.Title,
+        PrintableField.AlbumName,
+        PrintableField.ArtistName,
+        PrintableField.FolderPath,
+    }
+)
 
 
 def print_track_info(
-    content_list: Sequence[DjmdContent],
+    content_list: Sequence["DjmdContent"],
     print_columns: Sequence[PrintableField] | None = None,
 ):
-    """Print formatted track information"""
+    """Print formatted track information
+
+    Rows only need the attributes for print_columns, so rows from a
+    column-only query print just like DjmdContent objects.
+    """
     if not content_list:
         return
 
-    print_columns = print_columns or [
-        PrintableField.ID,
-        PrintableField.Title,
-        PrintableField.FileType,
-        PrintableField.SampleRate,
-        PrintableField.BitDepth,
-        PrintableField.FolderPath,
-    ]
+    print_columns = print_columns or DEFAULT_PRINT_COLUMNS
 
     # Calculate width for position column: 2 spaces + digits needed for max position
     pos_width = 2 + len(str(len(content_list)))
     header = f"{'#':<{pos_width}}" + "  ".join(
-        map(lambda col: PRINT_HEADERS[col], print_columns)
+        PRINT_HEADERS[col] for col in print_columns
     )
-    logger.info(header)
-    logger.info("-" * len(header))
+    # Build the row template once so each row is a single str.format call
+    row_template = f"{{:<{pos_width}}}" + "  ".join(
+        f"{{:<{PRINT_WIDTHS[col]}}}" for col in print_columns
+    )
+    # Fetch every column of a row in one call, then fix up only the cells that
+    # need it: long text is truncated and FileType is shown by name
+    get_row = operator.attrgetter(*(col.value for col in print_columns))
+    single_column = len(print_columns) == 1
+    truncated = [
+        (index, col)
+        for index, col in enumerate(print_columns)
+        if col in _TRUNCATED_FIELDS
+    ]
+    file_types = [
+        index
+        for index, col in enumerate(print_columns)
+        if col is PrintableField.FileType
+    ]
 
-    # Print each track
+    lines = [header, "-" * len(header)]
     for i, content in enumerate(content_list, 1):
-        # Print row
-        rows = {
-            PrintableField.ID: f"{content.ID:<{PRINT_WIDTHS[PrintableField.ID]}}",
-            PrintableField.FileNameL: f"{truncate_field(PrintableField.FileNameL, content.FileNameL):<{PRINT_WIDTHS[PrintableField.FileNameL]}}",
-            PrintableField.Title: f"{truncate_field(PrintableField.Title, content.Title):<{PRINT_WIDTHS[PrintableField.Title]}}",
-            PrintableField.AlbumName: f"{truncate_field(PrintableField.AlbumName, content.AlbumName):<{PRINT_WIDTHS[PrintableField.AlbumName]}}",
-            PrintableField.ArtistName: f"{truncate_field(PrintableField.ArtistName, content.ArtistName):<{PRINT_WIDTHS[PrintableField.ArtistName]}}",
-            PrintableField.FileType: f"{get_file_type_name(content.FileType):<{PRINT_WIDTHS[PrintableField.FileType]}}",
-            PrintableField.SampleRate: f"{content.SampleRate:<{PRINT_WIDTHS[PrintableField.SampleRate]}}",
-            PrintableField.BitRate: f"{content.BitRate:<{PRINT_WIDTHS[PrintableField.BitRate]}}",
-            PrintableField.BitDepth: f"{content.BitDepth:<{PRINT_WIDTHS[PrintableField.BitDepth]}}",
-            PrintableField.FolderPath: f"{truncate_field(PrintableField.FolderPath, content.FolderPath):<{PRINT_WIDTHS[PrintableField.FolderPath]}}",
-        }
+        row = [get_row(content)] if single_column else list(get_row(content))
+        for index, col in truncated:
+            row[index] = truncate_field(col, row[index])
+        for index in file_types:
+            row[index] = get_file_type_name(row[index])
+        lines.append(row_template.format(i, *row))
+    lines.append("")
 
-        row = f"{i:<{pos_width}}" + "  ".join(map(lambda col: rows[col], print_columns))
-
-        logger.info(row)
-    logger.info("")
+    # One record for the whole table instead of one per row
+    logger.info("\n".join(lines))
 
 
+@functools.cache
 def ffmpeg_in_path():
-    """Check availability of ffmpeg program via which command"""
+    """Check availability of ffmpeg program via which command
+
+    Cached, since it is checked before every conversion and probe and PATH
+    doesn't change during a run.
+    """
     return shutil.which("ffmpeg") is not None
 
 
@@ -202,46 +274,91 @@ or https://ffmpeg.org/download.html
 
 
 def get_audio_info(file_path) -> dict[str, int | None]:
-    """Get audio information from file using ffmpeg probe.
+    """Get audio information from a file's headers.
 
-    Returns None for any field that cannot be determined from the probe data.
+    Headers are read in-process with mutagen, which only touches the few blocks
+    that describe the stream. Files mutagen can't read fall back to ffmpeg probe.
+
+    Returns None for any field that cannot be determined from the file.
     Callers are responsible for handling None values and applying format-specific
     assumptions (e.g. MP3 has no true bit depth).
     """
+    try:
+        audio_info = read_audio_info(file_path)
+    except Exception as e:
+        logger.debug(f"mutagen could not read {file_path}: {e}")
+        audio_info = None
+
+    if audio_info is not None:
+        return audio_info
+
+    return probe_audio_info(file_path)
+
+
+def read_audio_info(file_path) -> dict[str, int | None] | None:
+    """Get audio information from file using mutagen.
+
+    Returns None if mutagen does not recognize the file type.
+    """
+    audio = mutagen.File(file_path)
+    if audio is None:
+        return None
+
+    info = audio.info
+    # Lossy formats (MP3, AAC) have no bits_per_sample, or report 0
+    bit_depth = getattr(info, "bits_per_sample", None) or None
+    # MP4 reports 16 bits for lossy AAC as well; only ALAC has a real bit depth
+    if isinstance(info, MP4Info) and info.codec != "alac":
+        bit_depth = None
+    bitrate = getattr(info, "bitrate", None)
+
+    return {
+        "bit_depth": bit_depth,
+        "sample_rate": int(info.sample_rate),
+        "channels": int(info.channels),
+        "bitrate": bitrate // 1000 if bitrate else None,
+    }
+
+
+# Bit depth of ffmpeg's integer sample formats ("p" suffix = planar). Float formats
+# are left out on purpose: lossy decoders (MP3, AAC) output fltp, which says
+# nothing about the source's bit depth.
+SAMPLE_FMT_BIT_DEPTHS: Dict[str, int] = {
+    "u8": 8,
+    "u8p": 8,
+    "s16": 16,
+    "s16p": 16,
+    "s24": 24,
+    "s32": 32,
+    "s32p": 32,
+    "s64": 64,
+    "s64p": 64,
+}
+
+
+def probe_audio_info(file_path) -> dict[str, int | None]:
+    """Get audio information from file using ffmpeg probe.
+
+    Returns None for any field that cannot be determined from the probe data.
+    """
     try:
         # Check if ffmpeg is available first
         if not ffmpeg_in_path():
             raise Exception(get_ffmpeg_directions())
 
-        probe = ffmpeg.probe(file_path)
-        audio_stream = next(
-            (stream for stream in probe["streams"] if stream["codec_type"] == "audio"),
-            None,
-        )
-        if not audio_stream:
+        # Only ask ffprobe for the first audio stream, not artwork or other streams
+        probe = ffmpeg.probe(file_path, select_streams="a:0")
+        if not probe["streams"]:
             raise Exception(f"No audio stream found in {file_path}")
-
-        # Try multiple ways to get bit depth
-        bit_depth = None
-
-        # Method 1: bits_per_sample
-        if "bits_per_sample" in audio_stream and audio_stream["bits_per_sample"] != 0:
-            bit_depth = int(audio_stream["bits_per_sample"])
-        # Method 2: bits_per_raw_sample
-        elif (
-            "bits_per_raw_sample" in audio_stream
-            and audio_stream["bits_per_raw_sample"] != 0
-        ):
-            bit_depth = int(audio_stream["bits_per_raw_sample"])
-        # Method 3: parse from sample_fmt (e.g., "s16", "s24", "s32")
-        elif "sample_fmt" in audio_stream:
-            sample_fmt = audio_stream["sample_fmt"]
-            if "16" in sample_fmt:
-                bit_depth = 16
-            elif "24" in sample_fmt:
-                bit_depth = 24
-            elif "32" in sample_fmt:
-                bit_depth = 32
+        audio_stream = probe["streams"][0]
+
+        # Prefer the explicit sample sizes, then the sample_fmt (e.g. "s16", "s24").
+        # ffprobe reports bits_per_raw_sample as a string, and either as 0 when unset
+        bit_depth = (
+            int(audio_stream.get("bits_per_sample") or 0)
+            or int(audio_stream.get("bits_per_raw_sample") or 0)
+            or SAMPLE_FMT_BIT_DEPTHS.get(audio_stream.get("sample_fmt"))
+        )
 
         if bit_depth is None:
             logger.debug(f"Could not determine bit depth for {file_path}")
@@ -272,6 +389,24 @@ def get_audio_info(file_path) -> dict[str, int | None]:
         raise e
 
 
+def get_audio_info_many(
+    file_paths: Sequence[str], workers: int | None = None
+) -> list[dict[str, int | None]]:
+    """Get audio information for several files, reading them concurrently.
+
+    Results are returned in the same order as file_paths. The first error raised
+    by get_audio_info is re-raised.
+    """
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(get_audio_info, file_paths))
+
+
+class ConfirmChoice(Enum):
+    YES = "y"
+    NO = "n"
+    QUIT = "q"
+
+
 def confirm(
     prompt: str,
     default: bool = False,
@@ -286,13 +421,6 @@ def confirm(
         binary: If True, prompt a simple y/n
         abort: If True, prompt a simple y/n where 'n' raises a UserQuit Exception
     """
-    from enum import Enum
-
-    class ConfirmChoice(Enum):
-        YES = "y"
-        NO = "n"
-        QUIT = "q"
-
     if abort or binary:
         choices = [ConfirmChoice.YES.value, ConfirmChoice.NO.value]
         default_choice = ConfirmChoice.YES.value if default else ConfirmChoice.NO.value
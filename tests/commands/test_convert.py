@@ -1,6 +1,8 @@
 """Unit tests for convert command functionality."""
 
 import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
 
 import ffmpeg
@@ -12,8 +14,12 @@ from rekordbox_bulk_edit.commands.convert import (
     convert_command,
     convert_to_lossless,
     convert_to_mp3,
+    file_exists,
+    get_output_bitrate,
     get_output_path,
+    list_folders,
     rollback_and_cleanup,
+    run_ffmpeg,
     update_database_record,
 )
 from rekordbox_bulk_edit.utils import OutputFormats, UserQuit
@@ -26,14 +32,73 @@ def mock_logger():
         yield mock_log
 
 
+@pytest.fixture(autouse=True)
+def mock_replace():
+    """Most command tests only fake their files via os.path.exists, so moving a
+    finished output into place only happens for files that really exist."""
+    real_replace = os.replace
+
+    def replace_if_real(src, dst):
+        if os.path.lexists(src):
+            real_replace(src, dst)
+
+    with patch(
+        "rekordbox_bulk_edit.commands.convert.os.replace", side_effect=replace_if_real
+    ) as mock_move:
+        yield mock_move
+
+
+@pytest.fixture(autouse=True)
+def mock_get_audio_info_many():
+    """Stub out the source pre-scan so command tests never read real files."""
+    with patch(
+        "rekordbox_bulk_edit.commands.convert.get_audio_info_many",
+        side_effect=lambda paths, workers=None: [{"bit_depth": 24} for _ in paths],
+    ) as mock_many:
+        yield mock_many
+
+
+class TestRunFfmpeg:
+    """Test run_ffmpeg function."""
+
+    @patch("rekordbox_bulk_edit.commands.convert.subprocess.run")
+    def test_run_ffmpeg_discards_output(self, mock_run):
+        """Runs quietly without stdin, with stdout discarded and only stderr piped."""
+        mock_run.return_value = Mock(returncode=0, stderr=b"")
+        stream = ffmpeg.input("input.flac").output("output.aiff").overwrite_output()
+
+        run_ffmpeg(stream)
+
+        args = mock_run.call_args.args[0]
+        assert args[0] == "ffmpeg"
+        assert args[-3:] == ["-loglevel", "error", "-nostats"]
+        assert mock_run.call_args.kwargs == {
+            "stdin": subprocess.DEVNULL,
+            "stdout": subprocess.DEVNULL,
+            "stderr": subprocess.PIPE,
+        }
+
+    @patch("rekordbox_bulk_edit.commands.convert.subprocess.run")
+    def test_run_ffmpeg_nonzero_exit_raises_ffmpeg_error(self, mock_run):
+        """A non-zero exit raises ffmpeg.Error carrying the captured stderr."""
+        mock_run.return_value = Mock(returncode=1, stderr=b"Invalid data found")
+        stream = ffmpeg.input("input.flac").output("output.aiff")
+
+        with pytest.raises(ffmpeg.Error) as exc_info:
+            run_ffmpeg(stream)
+
+        assert exc_info.value.stderr == b"Invalid data found"
+
+
 class TestConvertToLossless:
     """Test convert_to_lossless function."""
 
     @patch("rekordbox_bulk_edit.commands.convert.get_audio_info")
     @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
     @patch("rekordbox_bulk_edit.commands.convert.ffmpeg")
+    @patch("rekordbox_bulk_edit.commands.convert.run_ffmpeg")
     def test_convert_to_aiff_16bit(
-        self, mock_ffmpeg, mock_ffmpeg_in_path, mock_get_audio_info
+        self, mock_run_ffmpeg, mock_ffmpeg, mock_ffmpeg_in_path, mock_get_audio_info
     ):
         """Test converting to AIFF with 16-bit depth."""
         # Setup
@@ -44,24 +109,29 @@ class TestConvertToLossless:
         mock_ffmpeg.input.return_value = mock_input
         mock_input.output.return_value = mock_output
         mock_output.overwrite_output.return_value = mock_output
-        mock_output.run.return_value = None
 
         # Execute
         result = convert_to_lossless("input.flac", "output.aiff", OutputFormats.AIFF)
 
         # Assert
-        assert result is True
+        assert result == (True, 16)
+        mock_run_ffmpeg.assert_called_once_with(mock_output)
         mock_get_audio_info.assert_called_once_with("input.flac")
         mock_ffmpeg.input.assert_called_once_with("input.flac")
         mock_input.output.assert_called_once_with(
-            "output.aiff", acodec="pcm_s16be", map_metadata=0, write_id3v2=1
+            "output.aiff",
+            acodec="pcm_s16be",
+            vcodec="copy",
+            map_metadata=0,
+            write_id3v2=1,
         )
 
     @patch("rekordbox_bulk_edit.commands.convert.get_audio_info")
     @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
     @patch("rekordbox_bulk_edit.commands.convert.ffmpeg")
+    @patch("rekordbox_bulk_edit.commands.convert.run_ffmpeg")
     def test_convert_to_wav_24bit(
-        self, mock_ffmpeg, mock_ffmpeg_in_path, mock_get_audio_info
+        self, mock_run_ffmpeg, mock_ffmpeg, mock_ffmpeg_in_path, mock_get_audio_info
     ):
         """Test converting to WAV with 24-bit depth."""
         # Setup
@@ -72,22 +142,26 @@ class TestConvertToLossless:
         mock_ffmpeg.input.return_value = mock_input
         mock_input.output.return_value = mock_output
         mock_output.overwrite_output.return_value = mock_output
-        mock_output.run.return_value = None
 
         # Execute
         result = convert_to_lossless("input.flac", "output.wav", OutputFormats.WAV)
 
         # Assert
-        assert result is True
+        assert result == (True, 24)
         mock_input.output.assert_called_once_with(
-            "output.wav", acodec="pcm_s24le", map_metadata=0, write_id3v2=1
+            "output.wav",
+            acodec="pcm_s24le",
+            vcodec="copy",
+            map_metadata=0,
+            write_id3v2=1,
         )
 
     @patch("rekordbox_bulk_edit.commands.convert.get_audio_info")
     @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
     @patch("rekordbox_bulk_edit.commands.convert.ffmpeg")
+    @patch("rekordbox_bulk_edit.commands.convert.run_ffmpeg")
     def test_convert_to_flac(
-        self, mock_ffmpeg, mock_ffmpeg_in_path, mock_get_audio_info
+        self, mock_run_ffmpeg, mock_ffmpeg, mock_ffmpeg_in_path, mock_get_audio_info
     ):
         """Test converting to FLAC."""
         # Setup
@@ -98,22 +172,26 @@ class TestConvertToLossless:
         mock_ffmpeg.input.return_value = mock_input
         mock_input.output.return_value = mock_output
         mock_output.overwrite_output.return_value = mock_output
-        mock_output.run.return_value = None
 
         # Execute
         result = convert_to_lossless("input.wav", "output.flac", OutputFormats.FLAC)
 
         # Assert
-        assert result is True
+        assert result == (True, 24)
         mock_input.output.assert_called_once_with(
-            "output.flac", acodec="flac", map_metadata=0, write_id3v2=1
+            "output.flac",
+            acodec="flac",
+            vcodec="copy",
+            map_metadata=0,
+            write_id3v2=1,
         )
 
     @patch("rekordbox_bulk_edit.commands.convert.get_audio_info")
     @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
     @patch("rekordbox_bulk_edit.commands.convert.ffmpeg")
+    @patch("rekordbox_bulk_edit.commands.convert.run_ffmpeg")
     def test_convert_unsupported_format(
-        self, mock_ffmpeg, mock_ffmpeg_in_path, mock_get_audio_info
+        self, mock_run_ffmpeg, mock_ffmpeg, mock_ffmpeg_in_path, mock_get_audio_info
     ):
         """Test conversion with unsupported format raises exception."""
         # Setup
@@ -131,8 +209,9 @@ class TestConvertToLossless:
     @patch("rekordbox_bulk_edit.commands.convert.get_audio_info")
     @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
     @patch("rekordbox_bulk_edit.commands.convert.ffmpeg")
+    @patch("rekordbox_bulk_edit.commands.convert.run_ffmpeg")
     def test_convert_ffmpeg_error(
-        self, mock_ffmpeg, mock_ffmpeg_in_path, mock_get_audio_info
+        self, mock_run_ffmpeg, mock_ffmpeg, mock_ffmpeg_in_path, mock_get_audio_info
     ):
         """Test handling of ffmpeg errors."""
         # Setup
@@ -146,13 +225,72 @@ class TestConvertToLossless:
 
         # Create an ffmpeg.Error with stderr
         error = ffmpeg.Error("cmd", "stdout", "stderr")
-        mock_output.run.side_effect = error
+        mock_run_ffmpeg.side_effect = error
 
         # Execute
         result = convert_to_lossless("input.flac", "output.aiff", OutputFormats.AIFF)
 
         # Assert
-        assert result is False
+        assert result == (False, None)
+
+    @patch("rekordbox_bulk_edit.commands.convert.get_audio_info")
+    @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
+    @patch("rekordbox_bulk_edit.commands.convert.ffmpeg")
+    @patch("rekordbox_bulk_edit.commands.convert.run_ffmpeg")
+    def test_convert_to_lossless_with_known_audio_info_skips_probe(
+        self, mock_run_ffmpeg, mock_ffmpeg, mock_ffmpeg_in_path, mock_get_audio_info
+    ):
+        """Passing the source's audio info avoids reading the source again."""
+        mock_ffmpeg_in_path.return_value = True
+        mock_input = Mock()
+        mock_ffmpeg.input.return_value = mock_input
+
+        result = convert_to_lossless(
+            "input.flac", "output.aiff", OutputFormats.AIFF, {"bit_depth": 24}
+        )
+
+        assert result == (True, 24)
+        mock_get_audio_info.assert_not_called()
+        mock_input.output.assert_called_once_with(
+            "output.aiff",
+            acodec="pcm_s24be",
+            vcodec="copy",
+            map_metadata=0,
+            write_id3v2=1,
+        )
+
+    @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
+    @patch("rekordbox_bulk_edit.commands.convert.ffmpeg")
+    @patch("rekordbox_bulk_edit.commands.convert.run_ffmpeg")
+    def test_convert_to_lossless_threads(
+        self, mock_run_ffmpeg, mock_ffmpeg, mock_ffmpeg_in_path
+    ):
+        """threads is applied to both decoding and encoding."""
+        mock_ffmpeg_in_path.return_value = True
+        mock_input = Mock()
+        mock_output = Mock()
+        mock_ffmpeg.input.return_value = mock_input
+        mock_input.output.return_value = mock_output
+        mock_output.overwrite_output.return_value = mock_output
+
+        result = convert_to_lossless(
+            "input.flac",
+            "output.wav",
+            OutputFormats.WAV,
+            {"bit_depth": 16},
+            threads=1,
+        )
+
+        assert result == (True, 16)
+        mock_ffmpeg.input.assert_called_once_with("input.flac", threads=1)
+        mock_input.output.assert_called_once_with(
+            "output.wav",
+            acodec="pcm_s16le",
+            vcodec="copy",
+            map_metadata=0,
+            write_id3v2=1,
+            threads=1,
+        )
 
     @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
     def test_convert_to_lossless_ffmpeg_not_found(self, mock_ffmpeg_in_path):
@@ -165,8 +303,9 @@ class TestConvertToLossless:
     @patch("rekordbox_bulk_edit.commands.convert.get_audio_info")
     @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
     @patch("rekordbox_bulk_edit.commands.convert.ffmpeg")
+    @patch("rekordbox_bulk_edit.commands.convert.run_ffmpeg")
     def test_convert_to_lossless_unknown_bit_depth_falls_back(
-        self, mock_ffmpeg, mock_ffmpeg_in_path, mock_get_audio_info
+        self, mock_run_ffmpeg, mock_ffmpeg, mock_ffmpeg_in_path, mock_get_audio_info
     ):
         """When bit_depth is not in the codec map, falls back to first codec."""
         mock_ffmpeg_in_path.return_value = True
@@ -176,21 +315,26 @@ class TestConvertToLossless:
         mock_ffmpeg.input.return_value = mock_input
         mock_input.output.return_value = mock_output
         mock_output.overwrite_output.return_value = mock_output
-        mock_output.run.return_value = None
 
         result = convert_to_lossless("input.flac", "output.aiff", OutputFormats.AIFF)
 
-        assert result is True
+        # Reports the bit depth actually written, not the source's
+        assert result == (True, 16)
         # Falls back to first codec in map: pcm_s16be for AIFF
         mock_input.output.assert_called_once_with(
-            "output.aiff", acodec="pcm_s16be", map_metadata=0, write_id3v2=1
+            "output.aiff",
+            acodec="pcm_s16be",
+            vcodec="copy",
+            map_metadata=0,
+            write_id3v2=1,
         )
 
     @patch("rekordbox_bulk_edit.commands.convert.get_audio_info")
     @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
     @patch("rekordbox_bulk_edit.commands.convert.ffmpeg")
+    @patch("rekordbox_bulk_edit.commands.convert.run_ffmpeg")
     def test_convert_to_lossless_ffmpeg_error_no_stderr(
-        self, mock_ffmpeg, mock_ffmpeg_in_path, mock_get_audio_info
+        self, mock_run_ffmpeg, mock_ffmpeg, mock_ffmpeg_in_path, mock_get_audio_info
     ):
         """FfmpegError with no stderr skips the decode step and returns False."""
         mock_ffmpeg_in_path.return_value = True
@@ -202,17 +346,18 @@ class TestConvertToLossless:
         mock_output.overwrite_output.return_value = mock_output
 
         error = ffmpeg.Error("cmd", "stdout", None)  # no stderr
-        mock_output.run.side_effect = error
+        mock_run_ffmpeg.side_effect = error
 
         result = convert_to_lossless("input.flac", "output.aiff", OutputFormats.AIFF)
 
-        assert result is False
+        assert result == (False, None)
 
     @patch("rekordbox_bulk_edit.commands.convert.get_audio_info")
     @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
     @patch("rekordbox_bulk_edit.commands.convert.ffmpeg")
+    @patch("rekordbox_bulk_edit.commands.convert.run_ffmpeg")
     def test_convert_to_lossless_unexpected_exception_reraises(
-        self, mock_ffmpeg, mock_ffmpeg_in_path, mock_get_audio_info
+        self, mock_run_ffmpeg, mock_ffmpeg, mock_ffmpeg_in_path, mock_get_audio_info
     ):
         """Non-ffmpeg exceptions are re-raised after logging."""
         mock_ffmpeg_in_path.return_value = True
@@ -222,7 +367,7 @@ class TestConvertToLossless:
         mock_ffmpeg.input.return_value = mock_input
         mock_input.output.return_value = mock_output
         mock_output.overwrite_output.return_value = mock_output
-        mock_output.run.side_effect = RuntimeError("disk full")
+        mock_run_ffmpeg.side_effect = RuntimeError("disk full")
 
         with pytest.raises(RuntimeError, match="disk full"):
             convert_to_lossless("input.flac", "output.aiff", OutputFormats.AIFF)
@@ -234,8 +379,9 @@ class TestConvertToMp3:
     @patch("rekordbox_bulk_edit.commands.convert.get_audio_info")
     @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
     @patch("rekordbox_bulk_edit.commands.convert.ffmpeg")
+    @patch("rekordbox_bulk_edit.commands.convert.run_ffmpeg")
     def test_convert_to_mp3_success(
-        self, mock_ffmpeg, mock_ffmpeg_in_path, mock_get_audio_info
+        self, mock_run_ffmpeg, mock_ffmpeg, mock_ffmpeg_in_path, mock_get_audio_info
     ):
         """Test successful MP3 conversion."""
         # Setup
@@ -245,7 +391,6 @@ class TestConvertToMp3:
         mock_ffmpeg.input.return_value = mock_input
         mock_input.output.return_value = mock_output
         mock_output.overwrite_output.return_value = mock_output
-        mock_output.run.return_value = None
 
         # Execute
         result = convert_to_mp3("input.flac", "output.mp3")
@@ -257,6 +402,7 @@ class TestConvertToMp3:
             "output.mp3",
             acodec="libmp3lame",
             audio_bitrate="320k",
+            vcodec="copy",
             map_metadata=0,
             write_id3v2=1,
         )
@@ -264,8 +410,9 @@ class TestConvertToMp3:
     @patch("rekordbox_bulk_edit.commands.convert.get_audio_info")
     @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
     @patch("rekordbox_bulk_edit.commands.convert.ffmpeg")
+    @patch("rekordbox_bulk_edit.commands.convert.run_ffmpeg")
     def test_convert_to_mp3_ffmpeg_error(
-        self, mock_ffmpeg, mock_ffmpeg_in_path, mock_get_audio_info
+        self, mock_run_ffmpeg, mock_ffmpeg, mock_ffmpeg_in_path, mock_get_audio_info
     ):
         """Test MP3 conversion with ffmpeg error."""
         # Setup
@@ -277,7 +424,7 @@ class TestConvertToMp3:
         mock_output.overwrite_output.return_value = mock_output
 
         error = ffmpeg.Error("cmd", "stdout", "stderr")
-        mock_output.run.side_effect = error
+        mock_run_ffmpeg.side_effect = error
 
         # Execute
         result = convert_to_mp3("input.flac", "output.mp3")
@@ -295,8 +442,9 @@ class TestConvertToMp3:
 
     @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
     @patch("rekordbox_bulk_edit.commands.convert.ffmpeg")
+    @patch("rekordbox_bulk_edit.commands.convert.run_ffmpeg")
     def test_convert_to_mp3_ffmpeg_error_no_stderr(
-        self, mock_ffmpeg, mock_ffmpeg_in_path
+        self, mock_run_ffmpeg, mock_ffmpeg, mock_ffmpeg_in_path
     ):
         """FfmpegError with no stderr skips the decode step and returns False."""
         mock_ffmpeg_in_path.return_value = True
@@ -307,7 +455,7 @@ class TestConvertToMp3:
         mock_output.overwrite_output.return_value = mock_output
 
         error = ffmpeg.Error("cmd", "stdout", None)  # no stderr
-        mock_output.run.side_effect = error
+        mock_run_ffmpeg.side_effect = error
 
         result = convert_to_mp3("input.flac", "output.mp3")
 
@@ -315,8 +463,9 @@ class TestConvertToMp3:
 
     @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
     @patch("rekordbox_bulk_edit.commands.convert.ffmpeg")
+    @patch("rekordbox_bulk_edit.commands.convert.run_ffmpeg")
     def test_convert_to_mp3_unexpected_exception_reraises(
-        self, mock_ffmpeg, mock_ffmpeg_in_path
+        self, mock_run_ffmpeg, mock_ffmpeg, mock_ffmpeg_in_path
     ):
         """Non-ffmpeg exceptions are re-raised after logging."""
         mock_ffmpeg_in_path.return_value = True
@@ -325,7 +474,7 @@ class TestConvertToMp3:
         mock_ffmpeg.input.return_value = mock_input
         mock_input.output.return_value = mock_output
         mock_output.overwrite_output.return_value = mock_output
-        mock_output.run.side_effect = RuntimeError("permission denied")
+        mock_run_ffmpeg.side_effect = RuntimeError("permission denied")
 
         with pytest.raises(RuntimeError, match="permission denied"):
             convert_to_mp3("input.flac", "output.mp3")
@@ -341,21 +490,20 @@ class TestUpdateDatabaseRecord:
     ):
         """Test updating database record for FLAC conversion."""
         # Setup
-        mock_db = Mock()
         mock_content = make_djmd_content_item(ID=123, BitDepth=24)
-        mock_db.get_content().filter_by(ID=123).first.return_value = mock_content
 
         mock_join.return_value = "/path/to/output.flac"
         mock_get_audio_info.return_value = {"bitrate": 1000, "bit_depth": 24}
 
         # Execute
-        update_database_record(mock_db, 123, "output.flac", "/path/to", "FLAC")
+        update = update_database_record(mock_content, "output.flac", "/path/to", "FLAC")
 
         # Assert
-        assert mock_content.FileNameL == "output.flac"
-        assert mock_content.FolderPath == "/path/to/output.flac"
-        assert mock_content.FileType == 5  # FLAC file type
-        assert mock_content.BitRate == 0  # FLAC bitrate set to 0
+        assert update["ID"] == 123
+        assert update["FileNameL"] == "output.flac"
+        assert update["FolderPath"] == "/path/to/output.flac"
+        assert update["FileType"] == 5  # FLAC file type
+        assert update["BitRate"] == 0  # FLAC bitrate set to 0
 
     @patch("rekordbox_bulk_edit.commands.convert.get_audio_info")
     @patch("os.path.join")
@@ -364,31 +512,53 @@ class TestUpdateDatabaseRecord:
     ):
         """Test updating database record for MP3 conversion."""
         # Setup
-        mock_db = Mock()
         mock_content = make_djmd_content_item(ID=123)
-        mock_db.get_content().filter_by(ID=123).first.return_value = mock_content
 
         mock_join.return_value = "/path/to/output.mp3"
         mock_get_audio_info.return_value = {"bitrate": 320, "bit_depth": 16}
 
         # Execute
-        update_database_record(mock_db, 123, "output.mp3", "/path/to", "MP3")
+        update = update_database_record(mock_content, "output.mp3", "/path/to", "MP3")
 
         # Assert
-        assert mock_content.FileNameL == "output.mp3"
-        assert mock_content.FolderPath == "/path/to/output.mp3"
-        assert mock_content.FileType == 1  # MP3 file type
-        assert mock_content.BitRate == 320
+        assert update["FileNameL"] == "output.mp3"
+        assert update["FolderPath"] == "/path/to/output.mp3"
+        assert update["FileType"] == 1  # MP3 file type
+        assert update["BitRate"] == 320
 
-    def test_update_database_record_content_not_found(self):
-        """Test updating database record when content not found."""
-        # Setup
-        mock_db = Mock()
-        mock_db.get_content().filter_by(ID=123).first.return_value = None
+    @patch("rekordbox_bulk_edit.commands.convert.get_audio_info")
+    @patch("os.path.join")
+    def test_update_database_record_flac_with_known_bit_depth_skips_probe(
+        self, mock_join, mock_get_audio_info, make_djmd_content_item
+    ):
+        """A FLAC output with a bit depth from the conversion isn't probed."""
+        mock_content = make_djmd_content_item(ID=123, BitDepth=24)
 
-        # Execute & Assert
-        with pytest.raises(Exception, match="Content record with ID 123 not found"):
-            update_database_record(mock_db, 123, "output.flac", "/path/to", "FLAC")
+        mock_join.return_value = "/path/to/output.flac"
+
+        update = update_database_record(
+            mock_content, "output.flac", "/path/to", "FLAC", converted_bit_depth=24
+        )
+
+        mock_get_audio_info.assert_not_called()
+        assert update["FileType"] == 5
+        assert update["BitRate"] == 0
+
+    @patch("rekordbox_bulk_edit.commands.convert.get_audio_info")
+    @patch("os.path.join")
+    def test_update_database_record_known_bit_depth_mismatch(
+        self, mock_join, mock_get_audio_info, make_djmd_content_item
+    ):
+        """The bit depth from the conversion takes precedence over the probe."""
+        mock_content = make_djmd_content_item(ID=123, BitDepth=24)
+
+        mock_join.return_value = "/path/to/output.aiff"
+        mock_get_audio_info.return_value = {"bitrate": 2304, "bit_depth": 24}
+
+        with pytest.raises(Exception, match="Bit depth mismatch"):
+            update_database_record(
+                mock_content, "output.aiff", "/path/to", "AIFF", converted_bit_depth=16
+            )
 
     @patch("rekordbox_bulk_edit.commands.convert.get_audio_info")
     @patch("os.path.join")
@@ -397,16 +567,14 @@ class TestUpdateDatabaseRecord:
     ):
         """Test bit depth verification fails on mismatch."""
         # Setup
-        mock_db = Mock()
         mock_content = make_djmd_content_item(ID=123, BitDepth=16)
-        mock_db.get_content().filter_by(ID=123).first.return_value = mock_content
 
         mock_join.return_value = "/path/to/output.aiff"
         mock_get_audio_info.return_value = {"bitrate": 1000, "bit_depth": 24}
 
         # Execute & Assert
         with pytest.raises(Exception, match="Bit depth mismatch"):
-            update_database_record(mock_db, 123, "output.aiff", "/path/to", "AIFF")
+            update_database_record(mock_content, "output.aiff", "/path/to", "AIFF")
 
     @patch("rekordbox_bulk_edit.commands.convert.get_audio_info")
     @patch("os.path.join")
@@ -414,16 +582,14 @@ class TestUpdateDatabaseRecord:
         self, mock_join, mock_get_audio_info, make_djmd_content_item
     ):
         """MP3 conversion with None bitrate from probe defaults to 320kbps."""
-        mock_db = Mock()
         mock_content = make_djmd_content_item(ID=123)
-        mock_db.get_content().filter_by(ID=123).first.return_value = mock_content
 
         mock_join.return_value = "/path/to/output.mp3"
         mock_get_audio_info.return_value = {"bitrate": None, "bit_depth": 16}
 
-        update_database_record(mock_db, 123, "output.mp3", "/path/to", "MP3")
+        update = update_database_record(mock_content, "output.mp3", "/path/to", "MP3")
 
-        assert mock_content.BitRate == 320
+        assert update["BitRate"] == 320
 
     @patch("rekordbox_bulk_edit.commands.convert.get_file_type_for_format")
     @patch("rekordbox_bulk_edit.commands.convert.get_audio_info")
@@ -432,9 +598,7 @@ class TestUpdateDatabaseRecord:
         self, mock_join, mock_get_audio_info, mock_get_file_type, make_djmd_content_item
     ):
         """Unsupported output format raises an exception (when get_file_type returns None)."""
-        mock_db = Mock()
         mock_content = make_djmd_content_item(ID=123)
-        mock_db.get_content().filter_by(ID=123).first.return_value = mock_content
 
         mock_join.return_value = "/path/to/output.xyz"
         mock_get_audio_info.return_value = {"bitrate": 1000, "bit_depth": 16}
@@ -443,7 +607,58 @@ class TestUpdateDatabaseRecord:
         )
 
         with pytest.raises(Exception, match="Unsupported output format"):
-            update_database_record(mock_db, 123, "output.xyz", "/path/to", "XYZ")
+            update_database_record(mock_content, "output.xyz", "/path/to", "XYZ")
+
+    @patch("rekordbox_bulk_edit.commands.convert.get_audio_info")
+    @patch("os.path.join")
+    def test_update_database_record_known_bitrate_skips_probe(
+        self, mock_join, mock_get_audio_info, make_djmd_content_item
+    ):
+        """A PCM output with known bit depth and bitrate isn't probed."""
+        mock_content = make_djmd_content_item(ID=123, BitDepth=24)
+
+        mock_join.return_value = "/path/to/output.aiff"
+
+        update = update_database_record(
+            mock_content,
+            "output.aiff",
+            "/path/to",
+            "AIFF",
+            converted_bit_depth=24,
+            converted_bitrate=2116,
+        )
+
+        mock_get_audio_info.assert_not_called()
+        assert update["FileType"] == 12
+        assert update["BitRate"] == 2116
+
+
+class TestGetOutputBitrate:
+    """Test get_output_bitrate function."""
+
+    def test_mp3_is_320(self):
+        assert get_output_bitrate("mp3", None, None) == 320
+
+    def test_pcm_from_source_info(self):
+        audio_info = {"sample_rate": 44100, "channels": 2}
+        assert get_output_bitrate("AIFF", audio_info, 24) == 2116
+        assert get_output_bitrate("WAV", audio_info, 16) == 1411
+
+    def test_unknown_when_info_missing(self):
+        assert get_output_bitrate("WAV", None, 24) is None
+        assert (
+            get_output_bitrate("WAV", {"sample_rate": None, "channels": 2}, 24) is None
+        )
+        assert (
+            get_output_bitrate("AIFF", {"sample_rate": 44100, "channels": 2}, None)
+            is None
+        )
+
+    def test_flac_is_unknown(self):
+        assert (
+            get_output_bitrate("FLAC", {"sample_rate": 44100, "channels": 2}, 24)
+            is None
+        )
 
 
 class TestCleanupConvertedFiles:
@@ -475,6 +690,77 @@ class TestCleanupConvertedFiles:
         mock_remove.assert_called_once_with("/path/file1.aiff")
 
 
+class TestFileExists:
+    """Test file_exists function."""
+
+    def test_lists_each_folder_once(self, tmp_path):
+        """Checks in the same folder reuse one listing."""
+        (tmp_path / "song.flac").write_bytes(b"")
+        listings = {}
+
+        with patch("os.scandir", wraps=os.scandir) as mock_scandir:
+            assert file_exists(str(tmp_path / "song.flac"), listings)
+            assert not file_exists(str(tmp_path / "song.aiff"), listings)
+
+        mock_scandir.assert_called_once_with(str(tmp_path))
+
+    def test_ignores_case_and_unicode_normalization(self, tmp_path):
+        """Names match the way the default macOS filesystem would match them."""
+        (tmp_path / "Cafe\u0301.flac").write_bytes(b"")  # decomposed é
+
+        assert file_exists(str(tmp_path / "caf\u00e9.FLAC"), {})
+
+    @patch("os.path.exists")
+    def test_unlistable_folder_falls_back_to_exists(self, mock_exists, tmp_path):
+        """Folders that can't be listed are checked per file."""
+        mock_exists.return_value = True
+        missing_dir = tmp_path / "missing"
+
+        assert file_exists(str(missing_dir / "song.flac"), {})
+        mock_exists.assert_called_once_with(str(missing_dir / "song.flac"))
+
+
+class TestListFolders:
+    """Test list_folders function."""
+
+    def test_lists_every_folder_once(self, tmp_path):
+        """Each distinct folder is listed once and feeds file_exists."""
+        for name in ["a", "b"]:
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "song.flac").write_bytes(b"")
+        paths = [
+            str(tmp_path / "a" / "song.aiff"),
+            str(tmp_path / "a" / "other.aiff"),
+            str(tmp_path / "b" / "song.aiff"),
+        ]
+        listings = {}
+
+        with patch("os.scandir", wraps=os.scandir) as mock_scandir:
+            list_folders(paths, listings)
+            assert file_exists(str(tmp_path / "b" / "song.flac"), listings)
+
+        assert mock_scandir.call_count == 2
+        assert listings[str(tmp_path / "a")] == {"song.flac"}
+
+    def test_skips_listed_folders(self, tmp_path):
+        """Folders already in listings aren't listed again."""
+        listings = {str(tmp_path): {"cached.flac"}}
+
+        with patch("os.scandir") as mock_scandir:
+            list_folders([str(tmp_path / "song.aiff")], listings)
+
+        mock_scandir.assert_not_called()
+        assert listings[str(tmp_path)] == {"cached.flac"}
+
+    def test_unlistable_folder_is_none(self, tmp_path):
+        """Folders that can't be listed are recorded as None."""
+        listings = {}
+
+        list_folders([str(tmp_path / "missing" / "song.aiff")], listings)
+
+        assert listings == {str(tmp_path / "missing"): None}
+
+
 class TestRollbackAndCleanup:
     """Test rollback_and_cleanup function."""
 
@@ -547,15 +833,26 @@ class TestGetOutputPath:
         assert output_filename == "song.mp3"
         assert src_dirname == os.path.normpath("/music/folder")
 
+    def test_get_output_path_keeps_inner_dots(self, make_djmd_content_item):
+        """Only the final extension is replaced."""
+        content = make_djmd_content_item(
+            FileNameL="Artist - Song (feat. Other).v2.flac",
+            FolderPath="/music/folder/Artist - Song (feat. Other).v2.flac",
+        )
+
+        _, output_filename, _ = get_output_path(content, "aiff")
+
+        assert output_filename == "Artist - Song (feat. Other).v2.aiff"
+
 
 class TestConvertCommand:
     """Test convert_command function comprehensively."""
 
     @patch("rekordbox_bulk_edit.commands.convert.cleanup_converted_files")
     @patch("rekordbox_bulk_edit.commands.convert.confirm")
-    @patch("rekordbox_bulk_edit.commands.convert.get_rekordbox_pid")
-    @patch("rekordbox_bulk_edit.commands.convert.get_filtered_content")
-    @patch("rekordbox_bulk_edit.commands.convert.Rekordbox6Database")
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
     @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
     @patch("rekordbox_bulk_edit.commands.convert.convert_to_lossless")
     @patch("rekordbox_bulk_edit.commands.convert.update_database_record")
@@ -581,7 +878,7 @@ class TestConvertCommand:
         mock_get_rb_pid.return_value = None  # Rekordbox not running
         mock_ffmpeg_in_path.return_value = True  # FFmpeg available
         mock_dirname.return_value = "/output/folder"
-        mock_convert.return_value = True  # Conversion succeeds
+        mock_convert.return_value = (True, 24)  # Conversion succeeds
         mock_update_db.return_value = True  # Database update succeeds
         mock_confirm.return_value = True
         mock_cleanup_files.return_value = None
@@ -629,11 +926,18 @@ class TestConvertCommand:
         )
         mock_update_db.assert_called_once()
         mock_convert.assert_called_once()
+        # Records are written in one bulk update rather than one at a time
+        mock_db.session.execute.assert_called_once()
+        assert mock_db.session.execute.call_args.args[1] == [
+            mock_update_db.return_value
+        ]
+        # Source info from the pre-scan is handed to the conversion
+        assert mock_convert.call_args.args[3] == {"bit_depth": 24}
 
     @patch("rekordbox_bulk_edit.commands.convert.print_track_info")
-    @patch("rekordbox_bulk_edit.commands.convert.get_rekordbox_pid")
-    @patch("rekordbox_bulk_edit.commands.convert.get_filtered_content")
-    @patch("rekordbox_bulk_edit.commands.convert.Rekordbox6Database")
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
     @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
     @patch("os.path.exists")
     def test_dry_run_shows_files_to_convert(
@@ -674,9 +978,9 @@ class TestConvertCommand:
         mock_print_track_info.assert_called_once_with([mock_content])
         mock_db.session.commit.assert_not_called()
 
-    @patch("rekordbox_bulk_edit.commands.convert.get_rekordbox_pid")
-    @patch("rekordbox_bulk_edit.commands.convert.get_filtered_content")
-    @patch("rekordbox_bulk_edit.commands.convert.Rekordbox6Database")
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
     @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
     def test_filters_passed_to_get_filtered_content(
         self,
@@ -709,7 +1013,7 @@ class TestConvertCommand:
         assert call_kwargs["formats"] == ("flac",)
         assert call_kwargs["match_all"] is True
 
-    @patch("rekordbox_bulk_edit.commands.convert.get_rekordbox_pid")
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
     @patch("rekordbox_bulk_edit.commands.convert.confirm")
     def test_convert_command_rekordbox_running_prompts(
         self,
@@ -729,7 +1033,7 @@ class TestConvertCommand:
         assert result.exit_code == 0
         mock_confirm.assert_called_once()
 
-    @patch("rekordbox_bulk_edit.commands.convert.get_rekordbox_pid")
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
     @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
     def test_convert_command_ffmpeg_not_available_error(
         self,
@@ -748,9 +1052,9 @@ class TestConvertCommand:
         assert result.exit_code == 1
 
     @patch("rekordbox_bulk_edit.commands.convert.print_track_info")
-    @patch("rekordbox_bulk_edit.commands.convert.get_rekordbox_pid")
-    @patch("rekordbox_bulk_edit.commands.convert.get_filtered_content")
-    @patch("rekordbox_bulk_edit.commands.convert.Rekordbox6Database")
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
     @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
     @patch("os.path.exists")
     def test_convert_command_filters_out_lossy_formats(
@@ -764,7 +1068,7 @@ class TestConvertCommand:
         mock_logger,
         make_djmd_content_item,
     ):
-        """Test convert_command filters out MP3 and M4A files."""
+        """Test convert_command excludes MP3, M4A and target-format files in the query."""
         mock_get_rb_pid.return_value = None
         mock_ffmpeg_in_path.return_value = True
         mock_exists.return_value = False  # No output conflicts
@@ -780,22 +1084,8 @@ class TestConvertCommand:
             FolderPath="/music/song.flac",
         )
 
-        mock_mp3_content = make_djmd_content_item(
-            FileType=1,  # MP3
-            ID="BBBBBB",
-        )
-
-        mock_m4a_content = make_djmd_content_item(
-            FileType=4,  # M4A
-            ID="CCCCCC",
-        )
-
         mock_result = Mock()
-        mock_result.scalars().all.return_value = [
-            mock_flac_content,
-            mock_mp3_content,
-            mock_m4a_content,
-        ]
+        mock_result.scalars().all.return_value = [mock_flac_content]
         mock_get_filtered_content.return_value = mock_result
 
         from click.testing import CliRunner
@@ -805,10 +1095,17 @@ class TestConvertCommand:
 
         assert result.exit_code == 0
         mock_print_track_info.assert_called_once_with([mock_flac_content])
+        # MP3 (both codes), M4A and AIFF (the default target)
+        assert mock_get_filtered_content.call_args.kwargs["exclude_file_types"] == [
+            0,
+            1,
+            4,
+            12,
+        ]
 
-    @patch("rekordbox_bulk_edit.commands.convert.get_rekordbox_pid")
-    @patch("rekordbox_bulk_edit.commands.convert.get_filtered_content")
-    @patch("rekordbox_bulk_edit.commands.convert.Rekordbox6Database")
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
     @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
     @patch("rekordbox_bulk_edit.commands.convert.print_track_info")
     def test_convert_command_no_files_to_convert(
@@ -840,9 +1137,9 @@ class TestConvertCommand:
         mock_print_track_info.assert_not_called()
 
     @patch("rekordbox_bulk_edit.commands.convert.print_track_info")
-    @patch("rekordbox_bulk_edit.commands.convert.get_rekordbox_pid")
-    @patch("rekordbox_bulk_edit.commands.convert.get_filtered_content")
-    @patch("rekordbox_bulk_edit.commands.convert.Rekordbox6Database")
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
     @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
     @patch("os.path.exists")
     def test_convert_command_conflict_detection_without_overwrite(
@@ -891,9 +1188,9 @@ class TestConvertCommand:
         )
 
     @patch("rekordbox_bulk_edit.commands.convert.print_track_info")
-    @patch("rekordbox_bulk_edit.commands.convert.get_rekordbox_pid")
-    @patch("rekordbox_bulk_edit.commands.convert.get_filtered_content")
-    @patch("rekordbox_bulk_edit.commands.convert.Rekordbox6Database")
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
     @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
     @patch("os.path.exists")
     def test_convert_command_conflict_with_overwrite(
@@ -943,9 +1240,9 @@ class TestConvertCommand:
     @patch("os.remove")
     @patch("rekordbox_bulk_edit.commands.convert.cleanup_converted_files")
     @patch("rekordbox_bulk_edit.commands.convert.confirm")
-    @patch("rekordbox_bulk_edit.commands.convert.get_rekordbox_pid")
-    @patch("rekordbox_bulk_edit.commands.convert.get_filtered_content")
-    @patch("rekordbox_bulk_edit.commands.convert.Rekordbox6Database")
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
     @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
     @patch("rekordbox_bulk_edit.commands.convert.convert_to_lossless")
     @patch("rekordbox_bulk_edit.commands.convert.update_database_record")
@@ -968,7 +1265,7 @@ class TestConvertCommand:
         """Test convert_command with --delete flag removes original files."""
         mock_get_rb_pid.return_value = None
         mock_ffmpeg_in_path.return_value = True
-        mock_convert.return_value = True
+        mock_convert.return_value = (True, 24)
         mock_update_db.return_value = True
         mock_confirm.return_value = True
 
@@ -1030,9 +1327,9 @@ class TestConvertCommand:
         )
 
     @patch("rekordbox_bulk_edit.commands.convert.print_track_info")
-    @patch("rekordbox_bulk_edit.commands.convert.get_rekordbox_pid")
-    @patch("rekordbox_bulk_edit.commands.convert.get_filtered_content")
-    @patch("rekordbox_bulk_edit.commands.convert.Rekordbox6Database")
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
     @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
     @patch("os.path.exists")
     def test_convert_print_ids_with_dry_run(
@@ -1070,9 +1367,9 @@ class TestConvertCommand:
         assert "AAA111 BBB222" in result.output
 
     @patch("rekordbox_bulk_edit.commands.convert.print_track_info")
-    @patch("rekordbox_bulk_edit.commands.convert.get_rekordbox_pid")
-    @patch("rekordbox_bulk_edit.commands.convert.get_filtered_content")
-    @patch("rekordbox_bulk_edit.commands.convert.Rekordbox6Database")
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
     @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
     @patch("os.path.exists")
     def test_convert_print_silent_with_dry_run(
@@ -1109,7 +1406,7 @@ class TestConvertCommand:
         # Should have no output (no IDs, no track info)
         assert result.output.strip() == ""
 
-    @patch("rekordbox_bulk_edit.commands.convert.get_rekordbox_pid")
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
     def test_convert_rekordbox_running_scripting_mode_errors(
         self,
         mock_get_rb_pid,
@@ -1130,9 +1427,9 @@ class TestConvertCommand:
         )
 
     @patch("rekordbox_bulk_edit.commands.convert.print_track_info")
-    @patch("rekordbox_bulk_edit.commands.convert.get_rekordbox_pid")
-    @patch("rekordbox_bulk_edit.commands.convert.get_filtered_content")
-    @patch("rekordbox_bulk_edit.commands.convert.Rekordbox6Database")
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
     @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
     @patch("os.path.exists")
     def test_convert_conflicts_silent_with_yes(
@@ -1179,9 +1476,9 @@ class TestConvertCommand:
 
     @patch("os.remove")
     @patch("rekordbox_bulk_edit.commands.convert.cleanup_converted_files")
-    @patch("rekordbox_bulk_edit.commands.convert.get_rekordbox_pid")
-    @patch("rekordbox_bulk_edit.commands.convert.get_filtered_content")
-    @patch("rekordbox_bulk_edit.commands.convert.Rekordbox6Database")
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
     @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
     @patch("rekordbox_bulk_edit.commands.convert.convert_to_lossless")
     @patch("rekordbox_bulk_edit.commands.convert.update_database_record")
@@ -1203,7 +1500,7 @@ class TestConvertCommand:
         """Test lossless output defaults to deleting original files."""
         mock_get_rb_pid.return_value = None
         mock_ffmpeg_in_path.return_value = True
-        mock_convert.return_value = True
+        mock_convert.return_value = (True, 24)
         mock_update_db.return_value = True
 
         def mock_exists_side_effect(path):
@@ -1241,9 +1538,9 @@ class TestConvertCommand:
 
     @patch("os.remove")
     @patch("rekordbox_bulk_edit.commands.convert.cleanup_converted_files")
-    @patch("rekordbox_bulk_edit.commands.convert.get_rekordbox_pid")
-    @patch("rekordbox_bulk_edit.commands.convert.get_filtered_content")
-    @patch("rekordbox_bulk_edit.commands.convert.Rekordbox6Database")
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
     @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
     @patch("rekordbox_bulk_edit.commands.convert.convert_to_mp3")
     @patch("rekordbox_bulk_edit.commands.convert.update_database_record")
@@ -1303,9 +1600,9 @@ class TestConvertCommand:
 
     @patch("os.remove")
     @patch("rekordbox_bulk_edit.commands.convert.cleanup_converted_files")
-    @patch("rekordbox_bulk_edit.commands.convert.get_rekordbox_pid")
-    @patch("rekordbox_bulk_edit.commands.convert.get_filtered_content")
-    @patch("rekordbox_bulk_edit.commands.convert.Rekordbox6Database")
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
     @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
     @patch("rekordbox_bulk_edit.commands.convert.convert_to_lossless")
     @patch("rekordbox_bulk_edit.commands.convert.update_database_record")
@@ -1327,7 +1624,7 @@ class TestConvertCommand:
         """Test --keep prevents deletion even for lossless output."""
         mock_get_rb_pid.return_value = None
         mock_ffmpeg_in_path.return_value = True
-        mock_convert.return_value = True
+        mock_convert.return_value = (True, 24)
         mock_update_db.return_value = True
 
         def mock_exists_side_effect(path):
@@ -1365,9 +1662,9 @@ class TestConvertCommand:
 
     @patch("os.remove")
     @patch("rekordbox_bulk_edit.commands.convert.cleanup_converted_files")
-    @patch("rekordbox_bulk_edit.commands.convert.get_rekordbox_pid")
-    @patch("rekordbox_bulk_edit.commands.convert.get_filtered_content")
-    @patch("rekordbox_bulk_edit.commands.convert.Rekordbox6Database")
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
     @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
     @patch("rekordbox_bulk_edit.commands.convert.convert_to_mp3")
     @patch("rekordbox_bulk_edit.commands.convert.update_database_record")
@@ -1428,9 +1725,9 @@ class TestConvertCommand:
         mock_remove.assert_called_once_with("/music/folder/song.flac")
 
     @patch("rekordbox_bulk_edit.commands.convert.cleanup_converted_files")
-    @patch("rekordbox_bulk_edit.commands.convert.get_rekordbox_pid")
-    @patch("rekordbox_bulk_edit.commands.convert.get_filtered_content")
-    @patch("rekordbox_bulk_edit.commands.convert.Rekordbox6Database")
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
     @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
     @patch("rekordbox_bulk_edit.commands.convert.convert_to_lossless")
     @patch("rekordbox_bulk_edit.commands.convert.update_database_record")
@@ -1452,7 +1749,7 @@ class TestConvertCommand:
         """Test --print=ids with --yes outputs IDs of actually converted files."""
         mock_get_rb_pid.return_value = None
         mock_ffmpeg_in_path.return_value = True
-        mock_convert.return_value = True
+        mock_convert.return_value = (True, 24)
         mock_update_db.return_value = True
 
         def mock_exists_side_effect(path):
@@ -1487,140 +1784,311 @@ class TestConvertCommand:
         assert result.exit_code == 0
         assert "XYZ789" in result.output
 
-
-class TestConvertCommandErrorPaths:
-    """Tests for convert_command error handling and edge case branches."""
-
-    @patch("rekordbox_bulk_edit.commands.convert.get_rekordbox_pid")
-    @patch("rekordbox_bulk_edit.commands.convert.Rekordbox6Database")
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
     @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
-    def test_convert_command_no_db_session_exits(
+    @patch("rekordbox_bulk_edit.commands.convert.convert_to_lossless")
+    @patch("rekordbox_bulk_edit.commands.convert.update_database_record")
+    @patch("os.path.exists")
+    def test_convert_with_jobs_converts_all_files(
         self,
+        mock_exists,
+        mock_update_db,
+        mock_convert,
         mock_ffmpeg_in_path,
         mock_db_class,
+        mock_get_filtered_content,
         mock_get_rb_pid,
+        make_djmd_content_item,
         mock_db,
     ):
-        """Raises and exits when the database has no session."""
+        """With --jobs, every file is converted and each record updated once."""
         mock_get_rb_pid.return_value = None
         mock_ffmpeg_in_path.return_value = True
-        mock_db.session = None
-        mock_db_class.return_value = mock_db
-
-        from click.testing import CliRunner
+        mock_convert.return_value = (True, 24)
+        converted = set()
 
-        result = CliRunner().invoke(convert_command, ["--dry-run"])
+        def mock_convert_side_effect(
+            input_path, output_path, output_format, audio_info, threads
+        ):
+            converted.add(output_path)
+            return True, 24
 
-        assert result.exit_code != 0
+        mock_convert.side_effect = mock_convert_side_effect
+        mock_exists.side_effect = lambda path: (
+            path.endswith(".flac") or (path in converted)
+        )
+        mock_db_class.return_value = mock_db
 
-    @patch("rekordbox_bulk_edit.commands.convert.get_rekordbox_pid")
-    @patch("rekordbox_bulk_edit.commands.convert.confirm")
-    def test_convert_command_rekordbox_running_user_quits(
-        self,
-        mock_confirm,
-        mock_get_rb_pid,
-    ):
-        """Returns cleanly when UserQuit is raised from the Rekordbox-running prompt."""
-        mock_get_rb_pid.return_value = 12345
-        mock_confirm.side_effect = UserQuit()
+        contents = [
+            make_djmd_content_item(
+                FileType=5,
+                ID=f"ID{n}",
+                FileNameL=f"song{n}.flac",
+                FolderPath=f"/music/song{n}.flac",
+            )
+            for n in range(4)
+        ]
+        mock_result = Mock()
+        mock_result.scalars().all.return_value = contents
+        mock_get_filtered_content.return_value = mock_result
 
         from click.testing import CliRunner
 
-        result = CliRunner().invoke(convert_command, ["--dry-run"])
+        result = CliRunner().invoke(convert_command, ["--yes", "--keep", "--jobs", "2"])
 
         assert result.exit_code == 0
+        assert mock_convert.call_count == 4
+        updated_ids = sorted(call.args[0].ID for call in mock_update_db.call_args_list)
+        assert updated_ids == ["ID0", "ID1", "ID2", "ID3"]
+        mock_db.session.commit.assert_called_once()
 
-    @patch("rekordbox_bulk_edit.commands.convert.print_track_info")
-    @patch("rekordbox_bulk_edit.commands.convert.get_rekordbox_pid")
-    @patch("rekordbox_bulk_edit.commands.convert.get_filtered_content")
-    @patch("rekordbox_bulk_edit.commands.convert.Rekordbox6Database")
+    @patch("rekordbox_bulk_edit.commands.convert.ThreadPoolExecutor")
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
     @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
+    @patch("rekordbox_bulk_edit.commands.convert.convert_to_lossless")
+    @patch("rekordbox_bulk_edit.commands.convert.update_database_record")
     @patch("os.path.exists")
-    def test_convert_command_yes_partial_conflicts_continues(
+    def test_convert_jobs_capped_at_file_count(
         self,
         mock_exists,
+        mock_update_db,
+        mock_convert,
         mock_ffmpeg_in_path,
         mock_db_class,
         mock_get_filtered_content,
         mock_get_rb_pid,
-        mock_print_track_info,
-        mock_logger,
+        mock_executor_class,
         make_djmd_content_item,
         mock_db,
     ):
-        """--yes with partial conflicts skips conflicting files and processes the rest."""
+        """No more workers are started than there are files to convert."""
         mock_get_rb_pid.return_value = None
         mock_ffmpeg_in_path.return_value = True
+        mock_convert.return_value = (True, 24)
+        mock_exists.side_effect = lambda path: path.endswith(".flac")
+        mock_executor_class.side_effect = ThreadPoolExecutor
         mock_db_class.return_value = mock_db
 
-        content1 = make_djmd_content_item(
-            FileType=5, ID="AAA", FileNameL="song1.flac", FolderPath="/music/song1.flac"
-        )
-        content2 = make_djmd_content_item(
-            FileType=5, ID="BBB", FileNameL="song2.flac", FolderPath="/music/song2.flac"
-        )
         mock_result = Mock()
-        mock_result.scalars().all.return_value = [content1, content2]
+        mock_result.scalars().all.return_value = [
+            make_djmd_content_item(
+                FileType=5, ID="AAA", FileNameL="a.flac", FolderPath="/m/a.flac"
+            )
+        ]
         mock_get_filtered_content.return_value = mock_result
 
-        mock_exists.side_effect = lambda path: "song1.aiff" in path
-
         from click.testing import CliRunner
 
-        result = CliRunner().invoke(convert_command, ["--yes", "--dry-run"])
+        CliRunner().invoke(convert_command, ["--yes", "--keep", "--jobs", "8"])
 
-        assert result.exit_code == 0
-        mock_print_track_info.assert_called_once_with([content2])
+        mock_executor_class.assert_called_once_with(max_workers=1)
+        # A lone worker leaves ffmpeg to pick its own thread count
+        assert mock_convert.call_args.args[4] is None
 
-    @patch("rekordbox_bulk_edit.commands.convert.print_track_info")
-    @patch("rekordbox_bulk_edit.commands.convert.get_rekordbox_pid")
-    @patch("rekordbox_bulk_edit.commands.convert.get_filtered_content")
-    @patch("rekordbox_bulk_edit.commands.convert.Rekordbox6Database")
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
     @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
+    @patch("rekordbox_bulk_edit.commands.convert.convert_to_lossless")
+    @patch("rekordbox_bulk_edit.commands.convert.update_database_record")
     @patch("os.path.exists")
-    def test_convert_command_partial_conflicts_no_overwrite_continues(
+    def test_convert_groups_files_by_folder(
         self,
         mock_exists,
+        mock_update_db,
+        mock_convert,
         mock_ffmpeg_in_path,
         mock_db_class,
         mock_get_filtered_content,
         mock_get_rb_pid,
-        mock_print_track_info,
-        mock_logger,
         make_djmd_content_item,
         mock_db,
     ):
-        """Without --overwrite, conflicting files are warned and skipped; others proceed."""
+        """Files are converted folder by folder, whatever order the query returns."""
         mock_get_rb_pid.return_value = None
         mock_ffmpeg_in_path.return_value = True
+        mock_convert.return_value = (True, 24)
+        mock_exists.side_effect = lambda path: (
+            path.endswith(".flac") or mock_convert.call_count > 0
+        )
         mock_db_class.return_value = mock_db
 
-        content1 = make_djmd_content_item(
-            FileType=5, ID="AAA", FileNameL="song1.flac", FolderPath="/music/song1.flac"
-        )
-        content2 = make_djmd_content_item(
-            FileType=5, ID="BBB", FileNameL="song2.flac", FolderPath="/music/song2.flac"
-        )
         mock_result = Mock()
-        mock_result.scalars().all.return_value = [content1, content2]
+        mock_result.scalars().all.return_value = [
+            make_djmd_content_item(
+                FileType=5, ID="1", FileNameL="x.flac", FolderPath="/m/b/x.flac"
+            ),
+            make_djmd_content_item(
+                FileType=5, ID="2", FileNameL="y.flac", FolderPath="/m/a/y.flac"
+            ),
+            make_djmd_content_item(
+                FileType=5, ID="3", FileNameL="z.flac", FolderPath="/m/b/z.flac"
+            ),
+            make_djmd_content_item(
+                FileType=5, ID="4", FileNameL="w.flac", FolderPath="/m/a/w.flac"
+            ),
+        ]
         mock_get_filtered_content.return_value = mock_result
 
-        mock_exists.side_effect = lambda path: "song1.aiff" in path
+        from click.testing import CliRunner
+
+        CliRunner().invoke(convert_command, ["--yes", "--keep", "--jobs", "1"])
+
+        converted = [c.args[0] for c in mock_convert.call_args_list]
+        assert converted == [
+            "/m/a/w.flac",
+            "/m/a/y.flac",
+            "/m/b/x.flac",
+            "/m/b/z.flac",
+        ]
 
+    def test_convert_jobs_must_be_positive(self):
+        """--jobs rejects values below 1."""
         from click.testing import CliRunner
 
-        result = CliRunner().invoke(convert_command, ["--dry-run"])
+        result = CliRunner().invoke(convert_command, ["--dry-run", "--jobs", "0"])
 
-        assert result.exit_code == 0
-        mock_logger.warning.assert_called()
-        mock_print_track_info.assert_called_once_with([content2])
+        assert result.exit_code != 0
+        assert "--jobs" in result.output
 
-    @patch("rekordbox_bulk_edit.commands.convert.sys")
-    @patch("rekordbox_bulk_edit.commands.convert.confirm")
-    @patch("rekordbox_bulk_edit.commands.convert.get_rekordbox_pid")
-    @patch("rekordbox_bulk_edit.commands.convert.get_filtered_content")
-    @patch("rekordbox_bulk_edit.commands.convert.Rekordbox6Database")
-    @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
+
+class TestConvertCommandErrorPaths:
+    """Tests for convert_command error handling and edge case branches."""
+
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
+    @patch("pyrekordbox.Rekordbox6Database")
+    @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
+    def test_convert_command_no_db_session_exits(
+        self,
+        mock_ffmpeg_in_path,
+        mock_db_class,
+        mock_get_rb_pid,
+        mock_db,
+    ):
+        """Raises and exits when the database has no session."""
+        mock_get_rb_pid.return_value = None
+        mock_ffmpeg_in_path.return_value = True
+        mock_db.session = None
+        mock_db_class.return_value = mock_db
+
+        from click.testing import CliRunner
+
+        result = CliRunner().invoke(convert_command, ["--dry-run"])
+
+        assert result.exit_code != 0
+
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
+    @patch("rekordbox_bulk_edit.commands.convert.confirm")
+    def test_convert_command_rekordbox_running_user_quits(
+        self,
+        mock_confirm,
+        mock_get_rb_pid,
+    ):
+        """Returns cleanly when UserQuit is raised from the Rekordbox-running prompt."""
+        mock_get_rb_pid.return_value = 12345
+        mock_confirm.side_effect = UserQuit()
+
+        from click.testing import CliRunner
+
+        result = CliRunner().invoke(convert_command, ["--dry-run"])
+
+        assert result.exit_code == 0
+
+    @patch("rekordbox_bulk_edit.commands.convert.print_track_info")
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
+    @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
+    @patch("os.path.exists")
+    def test_convert_command_yes_partial_conflicts_continues(
+        self,
+        mock_exists,
+        mock_ffmpeg_in_path,
+        mock_db_class,
+        mock_get_filtered_content,
+        mock_get_rb_pid,
+        mock_print_track_info,
+        mock_logger,
+        make_djmd_content_item,
+        mock_db,
+    ):
+        """--yes with partial conflicts skips conflicting files and processes the rest."""
+        mock_get_rb_pid.return_value = None
+        mock_ffmpeg_in_path.return_value = True
+        mock_db_class.return_value = mock_db
+
+        content1 = make_djmd_content_item(
+            FileType=5, ID="AAA", FileNameL="song1.flac", FolderPath="/music/song1.flac"
+        )
+        content2 = make_djmd_content_item(
+            FileType=5, ID="BBB", FileNameL="song2.flac", FolderPath="/music/song2.flac"
+        )
+        mock_result = Mock()
+        mock_result.scalars().all.return_value = [content1, content2]
+        mock_get_filtered_content.return_value = mock_result
+
+        mock_exists.side_effect = lambda path: "song1.aiff" in path
+
+        from click.testing import CliRunner
+
+        result = CliRunner().invoke(convert_command, ["--yes", "--dry-run"])
+
+        assert result.exit_code == 0
+        mock_print_track_info.assert_called_once_with([content2])
+
+    @patch("rekordbox_bulk_edit.commands.convert.print_track_info")
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
+    @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
+    @patch("os.path.exists")
+    def test_convert_command_partial_conflicts_no_overwrite_continues(
+        self,
+        mock_exists,
+        mock_ffmpeg_in_path,
+        mock_db_class,
+        mock_get_filtered_content,
+        mock_get_rb_pid,
+        mock_print_track_info,
+        mock_logger,
+        make_djmd_content_item,
+        mock_db,
+    ):
+        """Without --overwrite, conflicting files are warned and skipped; others proceed."""
+        mock_get_rb_pid.return_value = None
+        mock_ffmpeg_in_path.return_value = True
+        mock_db_class.return_value = mock_db
+
+        content1 = make_djmd_content_item(
+            FileType=5, ID="AAA", FileNameL="song1.flac", FolderPath="/music/song1.flac"
+        )
+        content2 = make_djmd_content_item(
+            FileType=5, ID="BBB", FileNameL="song2.flac", FolderPath="/music/song2.flac"
+        )
+        mock_result = Mock()
+        mock_result.scalars().all.return_value = [content1, content2]
+        mock_get_filtered_content.return_value = mock_result
+
+        mock_exists.side_effect = lambda path: "song1.aiff" in path
+
+        from click.testing import CliRunner
+
+        result = CliRunner().invoke(convert_command, ["--dry-run"])
+
+        assert result.exit_code == 0
+        mock_logger.warning.assert_called()
+        mock_print_track_info.assert_called_once_with([content2])
+
+    @patch("rekordbox_bulk_edit.commands.convert.sys")
+    @patch("rekordbox_bulk_edit.commands.convert.confirm")
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
+    @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
     @patch("os.path.exists")
     def test_convert_command_user_declines_batch_confirmation(
         self,
@@ -1664,9 +2132,9 @@ class TestConvertCommandErrorPaths:
 
     @patch("rekordbox_bulk_edit.commands.convert.sys")
     @patch("rekordbox_bulk_edit.commands.convert.confirm")
-    @patch("rekordbox_bulk_edit.commands.convert.get_rekordbox_pid")
-    @patch("rekordbox_bulk_edit.commands.convert.get_filtered_content")
-    @patch("rekordbox_bulk_edit.commands.convert.Rekordbox6Database")
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
     @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
     @patch("os.path.exists")
     def test_convert_command_userquit_during_batch_confirmation(
@@ -1709,9 +2177,9 @@ class TestConvertCommandErrorPaths:
         assert result.exit_code == 0
 
     @patch("rekordbox_bulk_edit.commands.convert.confirm")
-    @patch("rekordbox_bulk_edit.commands.convert.get_rekordbox_pid")
-    @patch("rekordbox_bulk_edit.commands.convert.get_filtered_content")
-    @patch("rekordbox_bulk_edit.commands.convert.Rekordbox6Database")
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
     @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
     @patch("os.path.exists")
     def test_convert_command_interactive_user_skips_file(
@@ -1754,9 +2222,9 @@ class TestConvertCommandErrorPaths:
         mock_logger.info.assert_any_call("No files were converted.")
 
     @patch("rekordbox_bulk_edit.commands.convert.confirm")
-    @patch("rekordbox_bulk_edit.commands.convert.get_rekordbox_pid")
-    @patch("rekordbox_bulk_edit.commands.convert.get_filtered_content")
-    @patch("rekordbox_bulk_edit.commands.convert.Rekordbox6Database")
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
     @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
     @patch("os.path.exists")
     def test_convert_command_interactive_user_quits(
@@ -1796,9 +2264,9 @@ class TestConvertCommandErrorPaths:
         assert result.exit_code == 0
         mock_logger.info.assert_any_call("User quit. Rolling back...")
 
-    @patch("rekordbox_bulk_edit.commands.convert.get_rekordbox_pid")
-    @patch("rekordbox_bulk_edit.commands.convert.get_filtered_content")
-    @patch("rekordbox_bulk_edit.commands.convert.Rekordbox6Database")
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
     @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
     @patch("os.path.exists")
     def test_convert_command_source_not_found_exits(
@@ -1837,9 +2305,9 @@ class TestConvertCommandErrorPaths:
         mock_logger.error.assert_any_call("  Source not found: /music/song.flac")
 
     @patch("rekordbox_bulk_edit.commands.convert.convert_to_lossless")
-    @patch("rekordbox_bulk_edit.commands.convert.get_rekordbox_pid")
-    @patch("rekordbox_bulk_edit.commands.convert.get_filtered_content")
-    @patch("rekordbox_bulk_edit.commands.convert.Rekordbox6Database")
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
     @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
     @patch("os.path.exists")
     def test_convert_command_conversion_fails_exits(
@@ -1857,7 +2325,7 @@ class TestConvertCommandErrorPaths:
         """Exits with error and rolls back when conversion fails."""
         mock_get_rb_pid.return_value = None
         mock_ffmpeg_in_path.return_value = True
-        mock_convert.return_value = False
+        mock_convert.return_value = (False, None)
         mock_exists.side_effect = lambda path: "song.flac" in path
         mock_db_class.return_value = mock_db
 
@@ -1879,10 +2347,348 @@ class TestConvertCommandErrorPaths:
         assert result.exit_code == 1
         mock_logger.error.assert_any_call("  Conversion failed. Aborting.")
 
+    @patch("rekordbox_bulk_edit.commands.convert.signal.signal")
+    @patch("rekordbox_bulk_edit.commands.convert.cleanup_converted_files")
+    @patch("rekordbox_bulk_edit.commands.convert.update_database_record")
+    @patch("rekordbox_bulk_edit.commands.convert.convert_to_lossless")
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
+    @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
+    @patch("os.path.exists")
+    def test_convert_command_interrupt_drains_conversions(
+        self,
+        mock_exists,
+        mock_ffmpeg_in_path,
+        mock_db_class,
+        mock_get_filtered_content,
+        mock_get_rb_pid,
+        mock_convert,
+        mock_update_db,
+        mock_cleanup_files,
+        mock_signal,
+        mock_logger,
+        make_djmd_content_item,
+        mock_db,
+    ):
+        """Ctrl-C during conversion starts no more files and rolls back once,
+        removing outputs that finished before the interrupt reached ffmpeg."""
+        mock_get_rb_pid.return_value = None
+        mock_ffmpeg_in_path.return_value = True
+
+        def interrupt_during_conversion(input_path, output_path, fmt, info, threads):
+            handler = mock_signal.call_args.args[1]
+            # A second press while stopping is ignored
+            handler(2, None)
+            handler(2, None)
+            return True, 24
+
+        mock_convert.side_effect = interrupt_during_conversion
+        mock_exists.side_effect = lambda path: (
+            path.endswith(".flac") or mock_convert.call_count > 0
+        )
+        mock_db_class.return_value = mock_db
+
+        mock_result = Mock()
+        mock_result.scalars().all.return_value = [
+            make_djmd_content_item(
+                FileType=5, ID="AAA", FileNameL="a.flac", FolderPath="/m/a.flac"
+            ),
+            make_djmd_content_item(
+                FileType=5, ID="BBB", FileNameL="b.flac", FolderPath="/m/b.flac"
+            ),
+        ]
+        mock_get_filtered_content.return_value = mock_result
+
+        from click.testing import CliRunner
+
+        result = CliRunner().invoke(convert_command, ["--yes", "--jobs", "1"])
+
+        assert result.exit_code == 1
+        interrupted_logs = [
+            c for c in mock_logger.info.call_args_list if "Interrupted" in c.args[0]
+        ]
+        assert len(interrupted_logs) == 1
+        mock_cleanup_files.assert_called_once()
+        cleaned = mock_cleanup_files.call_args.args[0]
+        assert "AAA" in [f["content_id"] for f in cleaned]
+        mock_db.session.execute.assert_not_called()
+        mock_db.session.commit.assert_not_called()
+
+    @patch("rekordbox_bulk_edit.commands.convert.signal.signal")
+    @patch("rekordbox_bulk_edit.commands.convert.update_database_record")
+    @patch("rekordbox_bulk_edit.commands.convert.convert_to_lossless")
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
+    @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
+    def test_convert_command_interrupt_removes_killed_conversion_output(
+        self,
+        mock_ffmpeg_in_path,
+        mock_db_class,
+        mock_get_filtered_content,
+        mock_get_rb_pid,
+        mock_convert,
+        mock_update_db,
+        mock_signal,
+        make_djmd_content_item,
+        mock_db,
+        tmp_path,
+    ):
+        """Ctrl-C also kills the running ffmpeg; its partial output is removed."""
+        mock_get_rb_pid.return_value = None
+        mock_ffmpeg_in_path.return_value = True
+        source = tmp_path / "a.flac"
+        source.write_bytes(b"flac")
+
+        def killed_by_interrupt(input_path, output_path, fmt, info, threads):
+            with open(output_path, "wb") as f:
+                f.write(b"partial")
+            mock_signal.call_args.args[1](2, None)
+            return False, None
+
+        mock_convert.side_effect = killed_by_interrupt
+        mock_db_class.return_value = mock_db
+
+        mock_result = Mock()
+        mock_result.scalars().all.return_value = [
+            make_djmd_content_item(
+                FileType=5, ID="AAA", FileNameL="a.flac", FolderPath=str(source)
+            ),
+        ]
+        mock_get_filtered_content.return_value = mock_result
+
+        from click.testing import CliRunner
+
+        result = CliRunner().invoke(
+            convert_command, ["--yes", "--jobs", "1", "--format-out", "aiff"]
+        )
+
+        assert result.exit_code == 1
+        mock_convert.assert_called_once()
+        assert mock_convert.call_args.args[1] == str(tmp_path / ".partial-a.aiff")
+        assert sorted(os.listdir(tmp_path)) == ["a.flac"]
+        mock_update_db.assert_not_called()
+        mock_db.session.commit.assert_not_called()
+
+    @patch("rekordbox_bulk_edit.commands.convert.update_database_record")
+    @patch("rekordbox_bulk_edit.commands.convert.convert_to_lossless")
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
+    @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
+    def test_convert_command_failed_overwrite_keeps_existing_output(
+        self,
+        mock_ffmpeg_in_path,
+        mock_db_class,
+        mock_get_filtered_content,
+        mock_get_rb_pid,
+        mock_convert,
+        mock_update_db,
+        make_djmd_content_item,
+        mock_db,
+        tmp_path,
+    ):
+        """With --overwrite, a failed conversion leaves the existing output intact."""
+        mock_get_rb_pid.return_value = None
+        mock_ffmpeg_in_path.return_value = True
+        source = tmp_path / "a.flac"
+        source.write_bytes(b"flac")
+        existing = tmp_path / "a.aiff"
+        existing.write_bytes(b"original")
+
+        def fails_midway(input_path, output_path, fmt, info, threads):
+            with open(output_path, "wb") as f:
+                f.write(b"partial")
+            return False, None
+
+        mock_convert.side_effect = fails_midway
+        mock_db_class.return_value = mock_db
+
+        mock_result = Mock()
+        mock_result.scalars().all.return_value = [
+            make_djmd_content_item(
+                FileType=5, ID="AAA", FileNameL="a.flac", FolderPath=str(source)
+            ),
+        ]
+        mock_get_filtered_content.return_value = mock_result
+
+        from click.testing import CliRunner
+
+        result = CliRunner().invoke(
+            convert_command,
+            ["--yes", "--overwrite", "--jobs", "1", "--format-out", "aiff"],
+        )
+
+        assert result.exit_code == 1
+        assert existing.read_bytes() == b"original"
+        assert sorted(os.listdir(tmp_path)) == ["a.aiff", "a.flac"]
+        mock_db.session.commit.assert_not_called()
+
+    @patch("rekordbox_bulk_edit.commands.convert.update_database_record")
+    @patch("rekordbox_bulk_edit.commands.convert.convert_to_lossless")
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
+    @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
+    def test_convert_command_moves_finished_output_into_place(
+        self,
+        mock_ffmpeg_in_path,
+        mock_db_class,
+        mock_get_filtered_content,
+        mock_get_rb_pid,
+        mock_convert,
+        mock_update_db,
+        make_djmd_content_item,
+        mock_db,
+        tmp_path,
+    ):
+        """A finished conversion is renamed from its partial path to the output."""
+        mock_get_rb_pid.return_value = None
+        mock_ffmpeg_in_path.return_value = True
+        mock_update_db.return_value = {"ID": "AAA"}
+        source = tmp_path / "a.flac"
+        source.write_bytes(b"flac")
+
+        def converts(input_path, output_path, fmt, info, threads):
+            with open(output_path, "wb") as f:
+                f.write(b"aiff")
+            return True, 24
+
+        mock_convert.side_effect = converts
+        mock_db_class.return_value = mock_db
+
+        mock_result = Mock()
+        mock_result.scalars().all.return_value = [
+            make_djmd_content_item(
+                FileType=5, ID="AAA", FileNameL="a.flac", FolderPath=str(source)
+            ),
+        ]
+        mock_get_filtered_content.return_value = mock_result
+
+        from click.testing import CliRunner
+
+        result = CliRunner().invoke(
+            convert_command, ["--yes", "--keep", "--jobs", "1", "--format-out", "aiff"]
+        )
+
+        assert result.exit_code == 0
+        assert (tmp_path / "a.aiff").read_bytes() == b"aiff"
+        assert sorted(os.listdir(tmp_path)) == ["a.aiff", "a.flac"]
+        mock_db.session.commit.assert_called_once()
+
+    @patch("rekordbox_bulk_edit.commands.convert.signal.signal")
+    @patch("rekordbox_bulk_edit.commands.convert.rollback_and_cleanup")
+    @patch("rekordbox_bulk_edit.commands.convert.confirm")
+    @patch("rekordbox_bulk_edit.commands.convert.convert_to_lossless")
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
+    @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
+    @patch("os.path.exists")
+    def test_convert_command_interrupt_outside_conversion_exits(
+        self,
+        mock_exists,
+        mock_ffmpeg_in_path,
+        mock_db_class,
+        mock_get_filtered_content,
+        mock_get_rb_pid,
+        mock_convert,
+        mock_confirm,
+        mock_rollback,
+        mock_signal,
+        make_djmd_content_item,
+        mock_db,
+    ):
+        """Ctrl-C before any conversion starts rolls back and exits straight away."""
+        mock_get_rb_pid.return_value = None
+        mock_ffmpeg_in_path.return_value = True
+        mock_confirm.side_effect = lambda *args, **kwargs: mock_signal.call_args.args[
+            1
+        ](2, None)
+        mock_exists.side_effect = lambda path: path.endswith(".flac")
+        mock_db_class.return_value = mock_db
+
+        mock_result = Mock()
+        mock_result.scalars().all.return_value = [
+            make_djmd_content_item(
+                FileType=5, ID="AAA", FileNameL="a.flac", FolderPath="/m/a.flac"
+            )
+        ]
+        mock_get_filtered_content.return_value = mock_result
+
+        from click.testing import CliRunner
+
+        result = CliRunner().invoke(convert_command, ["--interactive", "--yes"])
+
+        assert result.exit_code == 1
+        mock_rollback.assert_called_once()
+        mock_convert.assert_not_called()
+
+    @patch("rekordbox_bulk_edit.commands.convert.cleanup_converted_files")
+    @patch("rekordbox_bulk_edit.commands.convert.update_database_record")
+    @patch("rekordbox_bulk_edit.commands.convert.convert_to_lossless")
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
+    @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
+    @patch("os.path.exists")
+    def test_convert_command_failure_cleans_up_finished_conversions(
+        self,
+        mock_exists,
+        mock_ffmpeg_in_path,
+        mock_db_class,
+        mock_get_filtered_content,
+        mock_get_rb_pid,
+        mock_convert,
+        mock_update_db,
+        mock_cleanup_files,
+        mock_logger,
+        make_djmd_content_item,
+        mock_db,
+    ):
+        """A failed conversion aborts the batch and removes outputs already written,
+        including whatever the failed ffmpeg left behind."""
+        mock_get_rb_pid.return_value = None
+        mock_ffmpeg_in_path.return_value = True
+        mock_convert.side_effect = lambda input_path, output_path, fmt, info, threads: (
+            "bad" not in input_path,
+            24,
+        )
+        mock_exists.side_effect = lambda path: (
+            path.endswith(".flac") or ("good" in path and mock_convert.call_count > 0)
+        )
+        mock_db_class.return_value = mock_db
+
+        mock_result = Mock()
+        mock_result.scalars().all.return_value = [
+            make_djmd_content_item(
+                FileType=5,
+                ID="AAA",
+                FileNameL="1-good.flac",
+                FolderPath="/m/1-good.flac",
+            ),
+            make_djmd_content_item(
+                FileType=5, ID="BBB", FileNameL="2-bad.flac", FolderPath="/m/2-bad.flac"
+            ),
+        ]
+        mock_get_filtered_content.return_value = mock_result
+
+        from click.testing import CliRunner
+
+        result = CliRunner().invoke(convert_command, ["--yes", "--jobs", "1"])
+
+        assert result.exit_code == 1
+        mock_logger.error.assert_any_call("  Conversion failed. Aborting.")
+        mock_db.session.execute.assert_not_called()
+        mock_db.session.commit.assert_not_called()
+        cleaned = mock_cleanup_files.call_args.args[0]
+        assert [f["content_id"] for f in cleaned] == ["AAA", "BBB"]
+
     @patch("rekordbox_bulk_edit.commands.convert.convert_to_lossless")
-    @patch("rekordbox_bulk_edit.commands.convert.get_rekordbox_pid")
-    @patch("rekordbox_bulk_edit.commands.convert.get_filtered_content")
-    @patch("rekordbox_bulk_edit.commands.convert.Rekordbox6Database")
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
     @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
     @patch("os.path.exists")
     def test_convert_command_output_not_created_exits(
@@ -1900,7 +2706,7 @@ class TestConvertCommandErrorPaths:
         """Exits with error when conversion succeeds but the output file is not created."""
         mock_get_rb_pid.return_value = None
         mock_ffmpeg_in_path.return_value = True
-        mock_convert.return_value = True
+        mock_convert.return_value = (True, 24)
         mock_exists.side_effect = lambda path: (
             "song.flac" in path
         )  # output never appears
@@ -1926,9 +2732,9 @@ class TestConvertCommandErrorPaths:
 
     @patch("rekordbox_bulk_edit.commands.convert.update_database_record")
     @patch("rekordbox_bulk_edit.commands.convert.convert_to_lossless")
-    @patch("rekordbox_bulk_edit.commands.convert.get_rekordbox_pid")
-    @patch("rekordbox_bulk_edit.commands.convert.get_filtered_content")
-    @patch("rekordbox_bulk_edit.commands.convert.Rekordbox6Database")
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
     @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
     @patch("os.path.exists")
     def test_convert_command_db_update_fails_exits(
@@ -1947,7 +2753,7 @@ class TestConvertCommandErrorPaths:
         """Exits with error and rolls back when the database update fails."""
         mock_get_rb_pid.return_value = None
         mock_ffmpeg_in_path.return_value = True
-        mock_convert.return_value = True
+        mock_convert.return_value = (True, 24)
         mock_update_db.side_effect = Exception("DB write failed")
         mock_exists.side_effect = lambda path: (
             "song.flac" in path or (mock_convert.call_count > 0 and "song.aiff" in path)
@@ -1972,11 +2778,64 @@ class TestConvertCommandErrorPaths:
         assert result.exit_code == 1
         mock_logger.error.assert_any_call("  Database update failed: DB write failed")
 
+    @patch("rekordbox_bulk_edit.commands.convert.rollback_and_cleanup")
     @patch("rekordbox_bulk_edit.commands.convert.update_database_record")
     @patch("rekordbox_bulk_edit.commands.convert.convert_to_lossless")
-    @patch("rekordbox_bulk_edit.commands.convert.get_rekordbox_pid")
-    @patch("rekordbox_bulk_edit.commands.convert.get_filtered_content")
-    @patch("rekordbox_bulk_edit.commands.convert.Rekordbox6Database")
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
+    @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
+    @patch("os.path.exists")
+    def test_convert_command_bulk_write_fails_exits(
+        self,
+        mock_exists,
+        mock_ffmpeg_in_path,
+        mock_db_class,
+        mock_get_filtered_content,
+        mock_get_rb_pid,
+        mock_convert,
+        mock_update_db,
+        mock_rollback,
+        mock_logger,
+        make_djmd_content_item,
+        mock_db,
+    ):
+        """Exits with error and rolls back when writing the batch fails."""
+        mock_get_rb_pid.return_value = None
+        mock_ffmpeg_in_path.return_value = True
+        mock_convert.return_value = (True, 24)
+        mock_update_db.return_value = {"ID": "AAA"}
+        mock_exists.side_effect = lambda path: (
+            "song.flac" in path or (mock_convert.call_count > 0 and "song.aiff" in path)
+        )
+        mock_db.session.execute.side_effect = Exception("DB write failed")
+        mock_db_class.return_value = mock_db
+
+        mock_result = Mock()
+        mock_result.scalars().all.return_value = [
+            make_djmd_content_item(
+                FileType=5,
+                ID="AAA",
+                FileNameL="song.flac",
+                FolderPath="/music/song.flac",
+            )
+        ]
+        mock_get_filtered_content.return_value = mock_result
+
+        from click.testing import CliRunner
+
+        result = CliRunner().invoke(convert_command, ["--yes"])
+
+        assert result.exit_code == 1
+        mock_logger.error.assert_any_call("  Database update failed: DB write failed")
+        mock_rollback.assert_called_once()
+        mock_db.session.commit.assert_not_called()
+
+    @patch("rekordbox_bulk_edit.commands.convert.update_database_record")
+    @patch("rekordbox_bulk_edit.commands.convert.convert_to_lossless")
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
     @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
     @patch("os.path.exists")
     def test_convert_command_commit_fails_exits(
@@ -1995,7 +2854,7 @@ class TestConvertCommandErrorPaths:
         """Exits with error when the database commit fails after successful conversion."""
         mock_get_rb_pid.return_value = None
         mock_ffmpeg_in_path.return_value = True
-        mock_convert.return_value = True
+        mock_convert.return_value = (True, 24)
         mock_update_db.return_value = None
         mock_db.session.commit.side_effect = Exception("Commit failed")
         mock_exists.side_effect = lambda path: (
@@ -2025,9 +2884,9 @@ class TestConvertCommandErrorPaths:
 class TestConvertStdinPiping:
     """Test convert command reading track IDs from stdin when piped."""
 
-    @patch("rekordbox_bulk_edit.commands.convert.get_rekordbox_pid")
-    @patch("rekordbox_bulk_edit.commands.convert.get_filtered_content")
-    @patch("rekordbox_bulk_edit.commands.convert.Rekordbox6Database")
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
     @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
     def test_reads_track_ids_from_stdin_when_piped(
         self,
@@ -2060,9 +2919,9 @@ class TestConvertStdinPiping:
         call_kwargs = mock_get_filtered_content.call_args.kwargs
         assert call_kwargs["track_id_args"] == ["190993005", "108916663", "59476253"]
 
-    @patch("rekordbox_bulk_edit.commands.convert.get_rekordbox_pid")
-    @patch("rekordbox_bulk_edit.commands.convert.get_filtered_content")
-    @patch("rekordbox_bulk_edit.commands.convert.Rekordbox6Database")
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
     @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
     def test_merges_stdin_ids_with_argument_ids(
         self,
@@ -2109,9 +2968,9 @@ class TestConvertStdinPiping:
         assert result.exit_code != 0
         assert "requires --dry-run or --yes" in result.output
 
-    @patch("rekordbox_bulk_edit.commands.convert.get_rekordbox_pid")
-    @patch("rekordbox_bulk_edit.commands.convert.get_filtered_content")
-    @patch("rekordbox_bulk_edit.commands.convert.Rekordbox6Database")
+    @patch("pyrekordbox.utils.get_rekordbox_pid")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
     @patch("rekordbox_bulk_edit.utils.ffmpeg_in_path")
     def test_empty_stdin_does_not_affect_track_ids(
         self,
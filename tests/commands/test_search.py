@@ -17,8 +17,8 @@ class TestSearchCommand:
     """Base tests for search command behaviour."""
 
     @patch("rekordbox_bulk_edit.commands.search.print_track_info")
-    @patch("rekordbox_bulk_edit.commands.search.get_filtered_content")
-    @patch("rekordbox_bulk_edit.commands.search.Rekordbox6Database")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
     def test_search_calls_print_track_info_by_default(
         self,
         mock_db_class,
@@ -33,7 +33,7 @@ class TestSearchCommand:
 
         content = make_djmd_content_item(ID="AAA111")
         mock_result = Mock()
-        mock_result.scalars.return_value.all.return_value = [content]
+        mock_result.all.return_value = [content]
         mock_get_filtered_content.return_value = mock_result
 
         from click.testing import CliRunner
@@ -42,16 +42,24 @@ class TestSearchCommand:
 
         assert result.exit_code == 0
         mock_print_track_info.assert_called_once_with([content])
+        # Only the printed columns are queried, not whole rows
+        assert mock_get_filtered_content.call_args.kwargs["columns"] == [
+            "ID",
+            "Title",
+            "FileType",
+            "SampleRate",
+            "BitDepth",
+            "FolderPath",
+        ]
 
     @patch("rekordbox_bulk_edit.commands.search.print_track_info")
-    @patch("rekordbox_bulk_edit.commands.search.get_filtered_content")
-    @patch("rekordbox_bulk_edit.commands.search.Rekordbox6Database")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
     def test_print_ids_outputs_space_separated_ids(
         self,
         mock_db_class,
         mock_get_filtered_content,
         mock_print_track_info,
-        make_djmd_content_item,
     ):
         """--print ids outputs space-separated track IDs."""
         mock_db = Mock()
@@ -59,10 +67,7 @@ class TestSearchCommand:
         mock_db.session = Mock()
 
         mock_result = Mock()
-        mock_result.scalars.return_value.all.return_value = [
-            make_djmd_content_item(ID="AAA111"),
-            make_djmd_content_item(ID="BBB222"),
-        ]
+        mock_result.scalars.return_value.all.return_value = ["AAA111", "BBB222"]
         mock_get_filtered_content.return_value = mock_result
 
         from click.testing import CliRunner
@@ -71,11 +76,13 @@ class TestSearchCommand:
 
         assert result.exit_code == 0
         assert "AAA111 BBB222" in result.output
+        # Only the IDs are queried, not whole rows
+        assert mock_get_filtered_content.call_args.kwargs["only_ids"] is True
         mock_print_track_info.assert_not_called()
 
     @patch("rekordbox_bulk_edit.commands.search.print_track_info")
-    @patch("rekordbox_bulk_edit.commands.search.get_filtered_content")
-    @patch("rekordbox_bulk_edit.commands.search.Rekordbox6Database")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
     def test_print_silent_produces_no_output(
         self,
         mock_db_class,
@@ -102,7 +109,7 @@ class TestSearchCommand:
         assert result.output.strip() == ""
         mock_print_track_info.assert_not_called()
 
-    @patch("rekordbox_bulk_edit.commands.search.Rekordbox6Database")
+    @patch("pyrekordbox.Rekordbox6Database")
     def test_search_no_db_session_raises(self, mock_db_class):
         """RuntimeError is raised (and propagated) when the db has no session."""
         mock_db = Mock()
@@ -116,8 +123,8 @@ class TestSearchCommand:
         assert result.exit_code != 0
 
     @patch("rekordbox_bulk_edit.commands.search.print_track_info")
-    @patch("rekordbox_bulk_edit.commands.search.get_filtered_content")
-    @patch("rekordbox_bulk_edit.commands.search.Rekordbox6Database")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
     def test_filters_passed_to_get_filtered_content(
         self,
         mock_db_class,
@@ -150,8 +157,8 @@ class TestSearchStdinPiping:
     """Test search command reading track IDs from stdin when piped."""
 
     @patch("rekordbox_bulk_edit.commands.search.print_track_info")
-    @patch("rekordbox_bulk_edit.commands.search.get_filtered_content")
-    @patch("rekordbox_bulk_edit.commands.search.Rekordbox6Database")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
     def test_reads_track_ids_from_stdin_when_piped(
         self,
         mock_db_class,
@@ -176,8 +183,8 @@ class TestSearchStdinPiping:
         assert call_kwargs["track_id_args"] == ["190993005", "108916663", "59476253"]
 
     @patch("rekordbox_bulk_edit.commands.search.print_track_info")
-    @patch("rekordbox_bulk_edit.commands.search.get_filtered_content")
-    @patch("rekordbox_bulk_edit.commands.search.Rekordbox6Database")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
     def test_merges_stdin_ids_with_argument_ids(
         self,
         mock_db_class,
@@ -211,8 +218,8 @@ class TestSearchStdinPiping:
         ]
 
     @patch("rekordbox_bulk_edit.commands.search.print_track_info")
-    @patch("rekordbox_bulk_edit.commands.search.get_filtered_content")
-    @patch("rekordbox_bulk_edit.commands.search.Rekordbox6Database")
+    @patch("rekordbox_bulk_edit.query.get_filtered_content")
+    @patch("pyrekordbox.Rekordbox6Database")
     def test_empty_stdin_does_not_affect_track_ids(
         self,
         mock_db_class,
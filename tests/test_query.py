@@ -197,7 +197,7 @@ class TestCollectionQuery:
 
     def test_by_playlist(self):
         """Test that the by_playlist method outer-joins with the DjmdPlaylist and DjmdSongPlaylist
-        tables and adds an ilike condition on the DjmdPlaylist.Name field."""
+        tables through an EXISTS condition with an ilike on DjmdPlaylist.Name."""
         query = CollectionQuery()
         playlist_name = "Test Playlist"
 
@@ -209,19 +209,20 @@ class TestCollectionQuery:
         # Check that a condition was added
         assert len(new_query._conditions) == 1
 
-        # Check that the statement includes outer joins with both tables
-        stmt_str = str(new_query._stmt).lower()
-        assert "left outer join" in stmt_str or "outer join" in stmt_str
-        assert "djmdsongplaylist" in stmt_str
-        assert "djmdplaylist" in stmt_str
+        # The playlist tables are only referenced by an EXISTS, never joined
+        assert str(new_query._stmt) == str(query._stmt)
+        condition_str = str(new_query._conditions[0]).lower()
+        assert condition_str.startswith("exists")
+        assert "djmdsongplaylist" in condition_str
+        assert "djmdplaylist" in condition_str
 
         # Check that the condition is an ilike operation
         condition_str = str(new_query._conditions[0]).lower()
         assert "like lower" in condition_str
 
     def test_by_exact_playlist(self):
-        """Test that the by_playlist method outer-joins with the DjmdPlaylist table and
-        adds an == condition on the DjmdPlaylist.Name field when exact is True."""
+        """Test that the by_playlist method uses an EXISTS condition with an == on
+        the DjmdPlaylist.Name field when exact is True."""
         query = CollectionQuery()
         playlist_name = "Exact Playlist"
 
@@ -233,11 +234,12 @@ class TestCollectionQuery:
         # Check that a condition was added
         assert len(new_query._conditions) == 1
 
-        # Check that the statement includes outer joins with both tables
-        stmt_str = str(new_query._stmt).lower()
-        assert "left outer join" in stmt_str or "outer join" in stmt_str
-        assert "djmdsongplaylist" in stmt_str
-        assert "djmdplaylist" in stmt_str
+        # The playlist tables are only referenced by an EXISTS, never joined
+        assert str(new_query._stmt) == str(query._stmt)
+        condition_str = str(new_query._conditions[0]).lower()
+        assert condition_str.startswith("exists")
+        assert "djmdsongplaylist" in condition_str
+        assert "djmdplaylist" in condition_str
 
         # Check that the condition is an equality operation (not ilike)
         condition_str = str(new_query._conditions[0]).lower()
@@ -247,11 +249,11 @@ class TestCollectionQuery:
     def test_by_format(self, mocker):
         """Test that the by_format method does not modify the statement and
         adds a condition on the DjmdContent.FileType field."""
-        # Mock the get_file_type_for_format function
+        # Mock the get_file_types_for_format function
         mock_get_file_type = mocker.patch(
-            "rekordbox_bulk_edit.utils.get_file_type_for_format"
+            "rekordbox_bulk_edit.utils.get_file_types_for_format"
         )
-        mock_get_file_type.return_value = 5  # Example file type code
+        mock_get_file_type.return_value = frozenset({5})  # Example file type code
 
         query = CollectionQuery()
         format_name = "FLAC"
@@ -276,6 +278,12 @@ class TestCollectionQuery:
         # Verify the helper function was called
         mock_get_file_type.assert_called_once_with(format_name)
 
+    def test_by_format_matches_every_code(self):
+        """Formats with several file type codes match all of them."""
+        query = CollectionQuery().by_format("mp3")
+        condition = query._conditions[0].compile(compile_kwargs={"literal_binds": True})
+        assert '"FileType" IN (0, 1)' in str(condition)
+
     def test_copy(self):
         """ """
         query = CollectionQuery()
@@ -299,6 +307,47 @@ class TestCollectionQuery:
         assert str(query_copy._stmt) == str(query._stmt)
         assert str(query_copy._get_full_statement()) == str(query._get_full_statement())
 
+    def test_substring_filters_escape_wildcards(self):
+        """LIKE wildcards in a substring filter are matched literally."""
+        query = CollectionQuery().by_title("100%_mix")
+        condition = query._conditions[0].compile(compile_kwargs={"literal_binds": True})
+        assert "'%100\\%\\_mix%'" in str(condition)
+        assert "ESCAPE '\\'" in str(condition)
+
+    def test_repeated_artist_and_album_filters_share_one_join(self):
+        """Repeated artist/album filters reuse the same join."""
+        query = (
+            CollectionQuery()
+            .by_artist("Daft Punk")
+            .by_artist("Justice", exact=True)
+            .by_album("Discovery")
+            .by_album("Cross")
+        )
+
+        assert len(query._conditions) == 4
+        stmt_str = str(query._get_full_statement()).lower()
+        assert stmt_str.count('join "djmdartist"') == 1
+        assert stmt_str.count('join "djmdalbum"') == 1
+
+    def test_repeated_playlist_filters_are_separate_exists(self):
+        """Each playlist filter is its own EXISTS, so match_all can require a
+        different matching playlist per filter."""
+        query = CollectionQuery().by_playlist("House").by_playlist("Techno")
+
+        stmt_str = str(query._get_full_statement()).lower()
+        assert "join" not in stmt_str
+        assert stmt_str.count("exists") == 2
+
+    def test_copies_extend_independently(self):
+        """Filters added to one copy don't leak into the original or a sibling."""
+        query = CollectionQuery()
+        with_artist = query.by_artist("Daft Punk")
+        with_album = query.by_album("Discovery")
+
+        assert "djmdArtist" not in str(query._stmt)
+        assert "djmdAlbum" not in str(with_artist._stmt)
+        assert "djmdArtist" not in str(with_album._stmt)
+
     def test_by_track_ids_single_string(self):
         """A single string ID is accepted and results in an IN condition."""
         query = CollectionQuery()
@@ -347,13 +396,14 @@ class TestCollectionQuery:
         assert "null" in condition_str
 
     def test_by_playlist_empty_string(self):
-        """Empty playlist name adds an IS NULL condition for tracks not in any playlist."""
+        """Empty playlist name adds a NOT EXISTS condition for tracks not in any
+        playlist."""
         query = CollectionQuery()
         new_query = query.by_playlist("")
 
         assert len(new_query._conditions) == 1
         condition_str = str(new_query._conditions[0]).lower()
-        assert "null" in condition_str
+        assert condition_str.startswith("not (exists")
 
     def test_by_format_empty_string(self, mocker):
         """Empty format string logs a warning and returns self unchanged."""
@@ -368,7 +418,7 @@ class TestCollectionQuery:
     def test_by_format_invalid(self, mocker):
         """Invalid format logs a warning and returns a copy without adding a condition."""
         mocker.patch(
-            "rekordbox_bulk_edit.utils.get_file_type_for_format",
+            "rekordbox_bulk_edit.utils.get_file_types_for_format",
             side_effect=ValueError("unknown format"),
         )
         mock_warn = mocker.patch("rekordbox_bulk_edit.query.logger")
@@ -414,6 +464,47 @@ class TestCollectionQuery:
         assert " and " in stmt_str
         assert " or " not in stmt_str
 
+    def test_without_file_types(self):
+        """Exclusions are kept apart from the filter conditions."""
+        query = CollectionQuery()
+        new_query = query.without_file_types([1, 4])
+
+        assert new_query is not query
+        assert new_query._conditions == []
+        assert new_query._excluded_file_types == [1, 4]
+        assert query._excluded_file_types == []
+        stmt_str = str(new_query._get_full_statement()).lower()
+        assert '"filetype" not in' in stmt_str
+
+    def test_without_file_types_applies_with_or_logic(self):
+        """Exclusions are ANDed with the filters even when they are ORed together."""
+        query = CollectionQuery().by_title("A").by_title("B").without_file_types([1])
+        stmt_str = str(query._get_full_statement()).lower()
+        assert " or " in stmt_str
+        assert " and " in stmt_str
+        assert '"filetype" not in' in stmt_str
+
+    def test_only_ids(self):
+        """only_ids() selects just the ID column and keeps the filter joins."""
+        query = CollectionQuery().by_artist("Daft Punk")
+        new_query = query.only_ids()
+
+        assert new_query is not query
+        assert new_query._columns == ("ID",)
+        assert query._columns == ()
+        stmt_str = str(new_query._get_full_statement()).lower()
+        assert stmt_str.startswith('select "djmdcontent"."id" \nfrom')
+        assert "join" in stmt_str
+
+    def test_only_columns(self):
+        """only_columns() selects just the named columns, in order."""
+        query = CollectionQuery().by_title("A").only_columns("ID", "FolderPath")
+
+        stmt_str = str(query._get_full_statement()).lower()
+        assert stmt_str.startswith(
+            'select "djmdcontent"."id", "djmdcontent"."folderpath" \nfrom'
+        )
+
 
 @pytest.fixture
 def mock_query(mocker):
@@ -425,6 +516,9 @@ def mock_query(mocker):
         "by_album",
         "by_playlist",
         "by_format",
+        "without_file_types",
+        "only_ids",
+        "only_columns",
         "match_all",
         "match_any",
     ]:
@@ -445,6 +539,7 @@ class TestGetFilteredContent:
         mock_query.by_playlist.assert_not_called()
         mock_query.by_format.assert_not_called()
         mock_query.match_all.assert_not_called()
+        mock_query.without_file_types.assert_not_called()
         mock_query.execute.assert_called_once_with(mock_db)
 
     def test_track_id_args(self, mock_db, mock_query):
@@ -453,9 +548,7 @@ class TestGetFilteredContent:
 
     def test_track_ids(self, mock_db, mock_query):
         get_filtered_content(mock_db, track_ids=["123", "456"])
-        assert mock_query.by_track_ids.call_count == 2
-        mock_query.by_track_ids.assert_any_call("123")
-        mock_query.by_track_ids.assert_any_call("456")
+        mock_query.by_track_ids.assert_called_once_with(["123", "456"])
 
     def test_artist(self, mock_db, mock_query):
         get_filtered_content(mock_db, artists=["Daft Punk"])
@@ -538,6 +631,23 @@ class TestGetFilteredContent:
         mock_query.by_artist.assert_called_once_with("Justice")
         mock_query.match_all.assert_not_called()
 
+    def test_exclude_file_types(self, mock_db, mock_query):
+        get_filtered_content(mock_db, formats=["flac"], exclude_file_types=[1, 4])
+        mock_query.without_file_types.assert_called_once_with([1, 4])
+
+    def test_only_ids(self, mock_db, mock_query):
+        get_filtered_content(mock_db, only_ids=True)
+        mock_query.only_ids.assert_called_once_with()
+
+    def test_columns(self, mock_db, mock_query):
+        get_filtered_content(mock_db, columns=["ID", "Title"])
+        mock_query.only_columns.assert_called_once_with("ID", "Title")
+
+    def test_only_ids_with_columns(self, mock_db, mock_query):
+        with pytest.raises(ValueError):
+            get_filtered_content(mock_db, only_ids=True, columns=["Title"])
+        mock_query.execute.assert_not_called()
+
     def test_no_session_raises(self, mock_db):
         """get_filtered_content raises RuntimeError when db has no session."""
         mock_db.session = None
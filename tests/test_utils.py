@@ -1,19 +1,24 @@
 """Unit tests for utils module functionality."""
 
+import wave
 from typing import Callable
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
+from mutagen.mp4 import MP4Info
 from pyrekordbox.db6 import DjmdContent
 
 from rekordbox_bulk_edit.utils import (
     PRINT_WIDTHS,
     PrintableField,
     UserQuit,
+    ffmpeg_in_path,
     get_audio_info,
+    get_audio_info_many,
     get_extension_for_format,
     get_file_type_for_format,
     get_file_type_name,
+    get_file_types_for_format,
     print_track_info,
 )
 
@@ -67,6 +72,18 @@ class TestGetFileTypeForFormat:
             get_file_type_for_format(None)  # ty: ignore[invalid-argument-type]
 
 
+class TestGetFileTypesForFormat:
+    def test_get_file_types_for_format(self):
+        """Test get_file_types_for_format returns every code for the format."""
+        assert get_file_types_for_format("mp3") == {0, 1}
+        assert get_file_types_for_format("FLAC") == {5}
+        assert get_file_types_for_format("aiff") == {12}
+
+    def test_get_file_types_for_format_invalid(self):
+        with pytest.raises(ValueError, match="Unknown format: invalid"):
+            get_file_types_for_format("invalid")
+
+
 class TestGetGetExtensionForFormat:
     def test_get_extension_for_format_case_insensitive(self):
         """Test get_extension_for_format is case-insensitive."""
@@ -247,6 +264,18 @@ class TestPrintTrackInfo:
         assert "FLAC" in captured.out
         assert "MP3" in captured.out
 
+    @patch("rekordbox_bulk_edit.utils.logger")
+    def test_table_is_logged_once(self, mock_logger, make_djmd_content_item):
+        """The whole table goes out as a single log record."""
+        contents = [make_djmd_content_item(ID=i) for i in range(3)]
+
+        print_track_info(contents)
+
+        mock_logger.info.assert_called_once()
+        lines = mock_logger.info.call_args.args[0].split("\n")
+        assert len(lines) == 6  # header, separator, 3 rows, trailing blank line
+        assert lines[-1] == ""
+
 
 class TestGetAudioInfo:
     """Test get_audio_info function."""
@@ -254,6 +283,9 @@ class TestGetAudioInfo:
     @pytest.fixture()
     def ffmpeg_exists(self, mocker):
         mocker.patch("rekordbox_bulk_edit.utils.shutil", return_value=True)
+        ffmpeg_in_path.cache_clear()
+        yield
+        ffmpeg_in_path.cache_clear()
 
     @patch("rekordbox_bulk_edit.utils.ffmpeg.probe")
     def test_get_audio_info_successful(self, mock_probe, ffmpeg_exists):
@@ -325,6 +357,29 @@ class TestGetAudioInfo:
         assert result["bit_depth"] == 32
         assert result["sample_rate"] == 96000
 
+    @pytest.mark.parametrize(
+        "sample_fmt,expected", [("s16p", 16), ("s32p", 32), ("fltp", None)]
+    )
+    @patch("rekordbox_bulk_edit.utils.ffmpeg.probe")
+    def test_get_audio_info__sample_fmt_lookup(
+        self, mock_probe, ffmpeg_exists, sample_fmt, expected
+    ):
+        """Planar integer formats map to their width; float formats are unknown."""
+        mock_probe.return_value = {
+            "streams": [
+                {
+                    "codec_type": "audio",
+                    "sample_fmt": sample_fmt,
+                    "sample_rate": "44100",
+                    "channels": 2,
+                }
+            ]
+        }
+
+        result = get_audio_info("/path/to/audio.flac")
+
+        assert result["bit_depth"] == expected
+
     @patch("rekordbox_bulk_edit.utils.ffmpeg.probe")
     def test_get_audio_info__calculated_bitrate(self, mock_probe, ffmpeg_exists):
         """Test bitrate calculation when not provided."""
@@ -351,9 +406,7 @@ class TestGetAudioInfo:
     def test_get_audio_info__no_audio_stream(self, mock_probe, ffmpeg_exists):
         """Test exception is raised when no audio stream exists."""
         # Setup mock probe response without audio stream
-        mock_probe.return_value = {
-            "streams": [{"codec_type": "video", "width": 1920, "height": 1080}]
-        }
+        mock_probe.return_value = {"streams": []}
 
         # Execute
         with pytest.raises(Exception, match="No audio stream"):
@@ -388,6 +441,28 @@ class TestGetAudioInfo:
         # Assert - should use sample_fmt parsing
         assert result["bit_depth"] == 24
 
+    @patch("rekordbox_bulk_edit.utils.ffmpeg.probe")
+    def test_get_audio_info__with_zero_raw_sample_string(
+        self, mock_probe, ffmpeg_exists
+    ):
+        """A "0" bits_per_raw_sample string falls through to sample_fmt."""
+        mock_probe.return_value = {
+            "streams": [
+                {
+                    "codec_type": "audio",
+                    "bits_per_sample": 0,
+                    "bits_per_raw_sample": "0",
+                    "sample_fmt": "s16",
+                    "sample_rate": "44100",
+                    "channels": 2,
+                }
+            ]
+        }
+
+        result = get_audio_info("/path/to/audio.flac")
+
+        assert result["bit_depth"] == 16
+
     @patch("rekordbox_bulk_edit.utils.ffmpeg.probe")
     def test_get_audio_info__unknown_bit_depth_returns_none(
         self, mock_probe, ffmpeg_exists
@@ -453,6 +528,111 @@ class TestGetAudioInfo:
         assert result["bitrate"] == 320
         assert result["sample_rate"] == 44100
 
+    @patch("rekordbox_bulk_edit.utils.ffmpeg.probe")
+    def test_get_audio_info__reads_headers_without_probe(self, mock_probe, tmp_path):
+        """Files mutagen understands are read in-process without spawning ffprobe."""
+        wav_path = tmp_path / "audio.wav"
+        with wave.open(str(wav_path), "wb") as wav:
+            wav.setnchannels(2)
+            wav.setsampwidth(3)  # 24-bit
+            wav.setframerate(48000)
+            wav.writeframes(b"\x00" * 6 * 480)
+
+        result = get_audio_info(str(wav_path))
+
+        assert result["bit_depth"] == 24
+        assert result["sample_rate"] == 48000
+        assert result["channels"] == 2
+        assert result["bitrate"] == 2304  # 48000 * 24 * 2 / 1000
+        mock_probe.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "codec,expected", [("mp4a.40.2", None), ("alac", 24)], ids=["aac", "alac"]
+    )
+    @patch("rekordbox_bulk_edit.utils.ffmpeg.probe")
+    @patch("rekordbox_bulk_edit.utils.mutagen.File")
+    def test_get_audio_info__mp4_bit_depth_only_for_alac(
+        self, mock_file, mock_probe, codec, expected
+    ):
+        """MP4 files only report a bit depth for ALAC, not the 16 given for AAC."""
+        info = Mock(
+            spec=MP4Info,
+            codec=codec,
+            bits_per_sample=16 if codec != "alac" else 24,
+            sample_rate=44100,
+            channels=2,
+            bitrate=256000,
+        )
+        mock_file.return_value = Mock(info=info)
+
+        result = get_audio_info("/path/to/audio.m4a")
+
+        assert result["bit_depth"] == expected
+        assert result["bitrate"] == 256
+        mock_probe.assert_not_called()
+
+    @patch("rekordbox_bulk_edit.utils.ffmpeg.probe")
+    def test_get_audio_info__unrecognized_file_falls_back_to_probe(
+        self, mock_probe, ffmpeg_exists, tmp_path
+    ):
+        """Files mutagen doesn't recognize are probed with ffprobe instead."""
+        unknown_path = tmp_path / "audio.xyz"
+        unknown_path.write_bytes(b"not audio")
+        mock_probe.return_value = {
+            "streams": [
+                {
+                    "codec_type": "audio",
+                    "bits_per_sample": 16,
+                    "sample_rate": "44100",
+                    "channels": 2,
+                }
+            ]
+        }
+
+        result = get_audio_info(str(unknown_path))
+
+        assert result["bit_depth"] == 16
+        mock_probe.assert_called_once_with(str(unknown_path), select_streams="a:0")
+
+
+class TestFfmpegInPath:
+    """Test ffmpeg_in_path function."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        ffmpeg_in_path.cache_clear()
+        yield
+        ffmpeg_in_path.cache_clear()
+
+    @patch("rekordbox_bulk_edit.utils.shutil.which", return_value="/usr/bin/ffmpeg")
+    def test_ffmpeg_in_path_looks_up_once(self, mock_which):
+        assert ffmpeg_in_path() is True
+        assert ffmpeg_in_path() is True
+        mock_which.assert_called_once_with("ffmpeg")
+
+    @patch("rekordbox_bulk_edit.utils.shutil.which", return_value=None)
+    def test_ffmpeg_in_path_missing(self, mock_which):
+        assert ffmpeg_in_path() is False
+
+
+class TestGetAudioInfoMany:
+    """Test get_audio_info_many function."""
+
+    @patch("rekordbox_bulk_edit.utils.get_audio_info")
+    def test_get_audio_info_many_preserves_order(self, mock_get_audio_info):
+        mock_get_audio_info.side_effect = lambda path: {"path": path}
+
+        result = get_audio_info_many(["a.flac", "b.flac", "c.flac"], workers=2)
+
+        assert result == [{"path": "a.flac"}, {"path": "b.flac"}, {"path": "c.flac"}]
+
+    @patch("rekordbox_bulk_edit.utils.get_audio_info")
+    def test_get_audio_info_many_reraises(self, mock_get_audio_info):
+        mock_get_audio_info.side_effect = Exception("No audio stream found")
+
+        with pytest.raises(Exception, match="No audio stream found"):
+            get_audio_info_many(["a.flac"])
+
 
 class TestConfirm:
     """Test confirm function."""